@@ -66,8 +66,8 @@ async def market_insights(
 async def extract_skills(text: str, enhanced: bool = True):
     """Extract skills from text."""
     try:
-        from backend.services.enhanced_skill_extractor import EnhancedSkillExtractor
-        extractor = EnhancedSkillExtractor()
+        from backend.services.enhanced_skill_extractor import get_skill_extractor
+        extractor = get_skill_extractor()
         skills = extractor.extract_skills_with_context(text)
         return {"skills": skills}
     except Exception as e:
@@ -79,8 +79,8 @@ async def extract_skills(text: str, enhanced: bool = True):
 async def skills_gap_endpoint(resume_text: str, job_description: str):
     """Analyze skill gaps between resume and job description."""
     try:
-        from backend.services.enhanced_skill_extractor import EnhancedSkillExtractor
-        extractor = EnhancedSkillExtractor()
+        from backend.services.enhanced_skill_extractor import get_skill_extractor
+        extractor = get_skill_extractor()
         resume_skills = extractor.extract_skills_with_context(resume_text)
         job_skills = extractor.extract_skills_with_context(job_description)
         comparison = extractor.compare_skills(resume_skills, job_skills)
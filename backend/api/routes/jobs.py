@@ -4,6 +4,7 @@ Jobs API Routes
 Endpoints for job search, matching, and posting.
 """
 
+import asyncio
 from typing import Dict, List, Optional
 
 from fastapi import APIRouter, HTTPException
@@ -14,7 +15,7 @@ from backend.services.vector_store import vector_store
 from backend.services.matcher import get_job_matcher
 from backend.services.job_scraper import get_job_scraper
 from backend.services.career_advisor import career_advisor
-from backend.services.enhanced_skill_extractor import EnhancedSkillExtractor
+from backend.services.enhanced_skill_extractor import get_skill_extractor
 
 logger = get_logger("routes.jobs")
 
@@ -129,7 +130,10 @@ async def match_jobs(request: JobMatchRequest):
 
         stats_after = vs.get_stats()
 
-        matches = matcher.match_resume_to_jobs(
+        # Embedding, LLM explanations and career advice are blocking — keep
+        # them off the event loop
+        matches = await asyncio.to_thread(
+            matcher.match_resume_to_jobs,
             request.resume_text,
             top_k=request.top_k,
             location=request.location,
@@ -139,13 +143,14 @@ async def match_jobs(request: JobMatchRequest):
 
         matches = [m for m in matches if m.get("match_score", 0) >= request.min_match_score]
 
-        advice = career_advisor.generate_career_advice(
+        advice = await asyncio.to_thread(
+            career_advisor.generate_career_advice,
             resume_text=request.resume_text,
             target_role=matcher._extract_target_role(request.resume_text),
             job_matches=matches,
         )
 
-        extractor = EnhancedSkillExtractor()
+        extractor = get_skill_extractor()
         resume_skills = extractor.extract_skills_with_context(request.resume_text)
         skill_comparison = {"resume_skills": resume_skills, "job_skills": []}
 
@@ -190,7 +195,7 @@ async def post_job(request: JobPostRequest):
             "posted_by": request.posted_by or "",
         }
 
-        indexed = vs.index_jobs([job])
+        indexed = await vs.aindex_jobs([job])
         return JobPostResponse(
             status="success",
             job_id=job["id"],
@@ -233,7 +238,7 @@ async def list_posted_jobs():
             return {"jobs": jobs, "total": len(jobs)}
         except Exception:
             # Fallback for older Chroma versions that don't support 'where' on get()
-            jobs = vs.search("job position employer posted", top_k=200)
+            jobs = await vs.asearch("job position employer posted", top_k=200)
             posted = [j for j in jobs if j.get("source") == "employer_posted"]
             return {"jobs": posted, "total": len(posted)}
 
@@ -258,7 +263,7 @@ async def vector_store_status():
         sample = []
         if stats["total_jobs"] > 0:
             try:
-                sample_jobs = vector_store.search("software", top_k=3)
+                sample_jobs = await vector_store.asearch("software", top_k=3)
                 sample = [
                     {"title": j.get("title", ""), "company": j.get("company", ""), "location": j.get("location", "")}
                     for j in sample_jobs
@@ -294,7 +299,7 @@ async def admin_refresh_jobs(resume_text: str = "", location: str = "India"):
         jobs = scraper.fetch_jobs(query=target_role, location=location, num_jobs=50)
 
         if jobs:
-            indexed = vs.index_jobs(jobs)
+            indexed = await vs.aindex_jobs(jobs)
             return {
                 "status": "success",
                 "jobs_fetched": len(jobs),
@@ -328,7 +333,7 @@ async def admin_force_refresh_jobs(
         if not jobs:
             return {"status": "error", "message": f"No jobs found for '{query}' in {location}", "jobs_fetched": 0}
 
-        indexed = vs.index_jobs(jobs)
+        indexed = await vs.aindex_jobs(jobs)
         return {
             "status": "success",
             "query": query,
@@ -363,7 +368,7 @@ async def admin_seed_mock_jobs(
             query=query, location=location, num_jobs=num_jobs,
         )
 
-        indexed = vs.index_jobs(mock_jobs)
+        indexed = await vs.aindex_jobs(mock_jobs)
         return {
             "status": "success",
             "jobs_created": len(mock_jobs),
@@ -392,7 +397,7 @@ async def admin_reset_vector_store():
             chroma_dir.mkdir(parents=True, exist_ok=True)
 
         if vector_store is not None:
-            vector_store.clear()
+            vector_store.clear(hard_reset=True)
 
         return {
             "status": "success",
@@ -433,7 +438,7 @@ async def _refresh_jobs(
         )
 
         if jobs:
-            vs.index_jobs(jobs)
+            await vs.aindex_jobs(jobs)
             logger.info(f"Refreshed {len(jobs)} jobs for query='{target_role}'")
     except Exception as e:
         logger.error(f"Job refresh failed: {e}")
\ No newline at end of file
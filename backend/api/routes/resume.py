@@ -4,6 +4,7 @@ Resume API Routes
 Endpoints for resume upload, parsing, analysis, and rewriting.
 """
 
+import asyncio
 from typing import Optional
 
 from fastapi import APIRouter, File, HTTPException, UploadFile, Depends
@@ -156,7 +157,11 @@ async def score_resume(request: ATSRequest):
     Provides ATS compatibility analysis and improvement suggestions.
     """
     try:
-        result = ats_scorer.score_resume(
+        # The scorer and rewriter call the LLM synchronously; keep them off
+        # the event loop, which would otherwise stall while they wait on
+        # ai_pipeline's provider slots.
+        result = await asyncio.to_thread(
+            ats_scorer.score_resume,
             request.resume_text,
             request.target_role,
             request.job_description
@@ -175,7 +180,8 @@ async def rewrite_resume(request: ResumeRewriteRequest):
     Improves language, highlights relevant skills, and optimizes for ATS.
     """
     try:
-        result = resume_rewriter.rewrite(
+        result = await asyncio.to_thread(
+            resume_rewriter.rewrite,
             request.resume_text,
             request.target_role,
             request.tone
@@ -198,7 +204,8 @@ async def analyze_resume(request: ResumeAnalyzeRequest):
     try:
         from backend.services.ats_scorer import get_ats_scorer
         scorer = get_ats_scorer()
-        ats_result = scorer.score(
+        ats_result = await asyncio.to_thread(
+            scorer.score,
             resume_text=request.resume_text,
             target_role=request.target_role,
             job_description=request.job_description or "",
@@ -208,7 +215,8 @@ async def analyze_resume(request: ResumeAnalyzeRequest):
         logger.error(f"ATS scoring error: {e}", exc_info=True)
     
     try:
-        hr_panel = _generate_hr_panel(
+        hr_panel = await asyncio.to_thread(
+            _generate_hr_panel,
             resume_text=request.resume_text,
             target_role=request.target_role,
             company_type=request.company_type,
@@ -12,7 +12,7 @@ from pydantic import BaseModel
 from backend.core.logging import get_logger
 from backend.services.roadmap_generator import get_roadmap_generator
 from backend.services.project_generator import get_project_generator
-from backend.services.enhanced_skill_extractor import EnhancedSkillExtractor
+from backend.services.enhanced_skill_extractor import get_skill_extractor
 
 logger = get_logger("routes.roadmap")
 
@@ -55,7 +55,7 @@ async def generate_roadmap(request: RoadmapRequest):
     try:
         skill_gaps = request.skill_gaps
         if not skill_gaps:
-            extractor = EnhancedSkillExtractor()
+            extractor = get_skill_extractor()
             skills = extractor.extract_skills_with_context(request.resume_text)
             skill_gaps = [s["skill"] for s in skills[:5]] if skills else ["Python", "SQL", "System Design"]
 
@@ -38,6 +38,7 @@ import hashlib
 import json
 import logging
 import re
+import threading
 import time
 from typing import Any, Dict, List, Optional, Type, TypeVar
 
@@ -53,9 +54,12 @@ T = TypeVar("T", bound=BaseModel)
 
 # ── In-memory response cache ──────────────────────────────────────────────────
 # Structure: cache_key → {"value": str, "expires": float, "hits": int}
-# Not thread-safe for multi-process deployments — use Redis in production (Phase 2).
+# Per-process only — use Redis for multi-process deployments (Phase 2).
+# Callers fan out across threads (e.g. match explanations), so every access
+# to the cache and the counters below holds _lock.
 
 _cache: Dict[str, Dict[str, Any]] = {}
+_lock = threading.Lock()
 _DEFAULT_TTL: int = 3600          # 1 hour
 _MAX_CACHE_ENTRIES: int = 512     # evict oldest when exceeded
 
@@ -66,40 +70,44 @@ def _cache_key(system: str, user: str, temp: float, max_tokens: int) -> str:
 
 
 def _get_cached(key: str) -> Optional[str]:
-    entry = _cache.get(key)
-    if entry is None:
-        return None
-    if time.time() >= entry["expires"]:
-        del _cache[key]
-        return None
-    entry["hits"] += 1
-    return entry["value"]
+    with _lock:
+        entry = _cache.get(key)
+        if entry is None:
+            return None
+        if time.time() >= entry["expires"]:
+            del _cache[key]
+            return None
+        entry["hits"] += 1
+        return entry["value"]
 
 
 def _set_cached(key: str, value: str, ttl: int = _DEFAULT_TTL) -> None:
-    # Simple LRU eviction: drop the oldest entry when at capacity
-    if len(_cache) >= _MAX_CACHE_ENTRIES:
-        oldest_key = next(iter(_cache))
-        del _cache[oldest_key]
-    _cache[key] = {"value": value, "expires": time.time() + ttl, "hits": 0}
+    with _lock:
+        # Simple LRU eviction: drop the oldest entry when at capacity
+        if key not in _cache and len(_cache) >= _MAX_CACHE_ENTRIES:
+            del _cache[next(iter(_cache))]
+        _cache[key] = {"value": value, "expires": time.time() + ttl, "hits": 0}
 
 
 def clear_cache() -> int:
     """Clear all cached responses. Returns the number of entries removed."""
-    n = len(_cache)
-    _cache.clear()
+    with _lock:
+        n = len(_cache)
+        _cache.clear()
     return n
 
 
 def cache_stats() -> Dict[str, int]:
     """Return a snapshot of cache health metrics."""
     now = time.time()
-    live = sum(1 for e in _cache.values() if now < e["expires"])
-    total_hits = sum(e["hits"] for e in _cache.values())
+    with _lock:
+        entries = list(_cache.values())
+    live = sum(1 for e in entries if now < e["expires"])
+    total_hits = sum(e["hits"] for e in entries)
     return {
-        "total_entries": len(_cache),
+        "total_entries": len(entries),
         "live_entries": live,
-        "expired_entries": len(_cache) - live,
+        "expired_entries": len(entries) - live,
         "total_hits": total_hits,
         "capacity": _MAX_CACHE_ENTRIES,
     }
@@ -169,15 +177,31 @@ _token_counters: Dict[str, int] = {
 }
 
 
+def _count(name: str) -> None:
+    with _lock:
+        _token_counters[name] += 1
+
+
 def get_counters() -> Dict[str, int]:
     """Return a copy of the AI usage counters (reset on process restart)."""
-    return dict(_token_counters)
+    with _lock:
+        return dict(_token_counters)
 
 
 def reset_counters() -> None:
     """Reset all counters to zero (useful in tests)."""
-    for k in _token_counters:
-        _token_counters[k] = 0
+    with _lock:
+        for k in _token_counters:
+            _token_counters[k] = 0
+
+
+# ── Provider concurrency cap ──────────────────────────────────────────────────
+# Free-tier Groq/Gemini keys allow ~30 requests/min and reject bursts, so at
+# most this many provider calls are in flight across all threads; extra
+# callers queue here instead of burning their retries on 429s.
+
+_MAX_CONCURRENT_LLM_CALLS: int = 4
+_llm_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_LLM_CALLS)
 
 
 # ── Core pipeline call ────────────────────────────────────────────────────────
@@ -220,14 +244,14 @@ def call(
         :class:`~backend.core.exceptions.LLMUnavailableError`:
             All configured providers failed.
     """
-    _token_counters["total_calls"] += 1
+    _count("total_calls")
 
     # ── Cache check ───────────────────────────────────────────────────────────
     if use_cache:
         key = _cache_key(system, user, temp, max_tokens)
         cached = _get_cached(key)
         if cached is not None:
-            _token_counters["cache_hits"] += 1
+            _count("cache_hits")
             logger.debug("Cache hit (%s…)", key[:10])
             return cached
 
@@ -235,8 +259,9 @@ def call(
     try:
         from backend.services.llm import llm_call_sync, llm_call_smart_sync  # noqa: PLC0415
         fn = llm_call_smart_sync if smart else llm_call_sync
-        result: str = fn(system=system, user=user, temp=temp, max_tokens=max_tokens)
-        _token_counters["llm_calls"] += 1
+        with _llm_slots:
+            result: str = fn(system=system, user=user, temp=temp, max_tokens=max_tokens)
+        _count("llm_calls")
     except RuntimeError as exc:
         log_ai_error(logger, AIErrorCategory.LLM_UNAVAILABLE, str(exc))
         raise LLMUnavailableError(str(exc)) from exc
@@ -349,7 +374,7 @@ def call_json(
     try:
         return json.loads(fixed)
     except json.JSONDecodeError as exc:
-        _token_counters["parse_errors"] += 1
+        _count("parse_errors")
         raise LLMParseError(
             f"Could not parse LLM JSON response after 3 repair attempts: {exc}",
             detail={"raw_preview": cleaned[:300]},
@@ -409,7 +434,7 @@ def call_structured(
                 "Structured call fell back to default for %s: %s",
                 schema.__name__, exc,
             )
-            _token_counters["fallbacks_triggered"] += 1
+            _count("fallbacks_triggered")
             return fallback
         raise
 
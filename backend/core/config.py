@@ -98,6 +98,16 @@ class Settings(BaseSettings):
     # ── Vector DB ─────────────────────────────────────────────────────────────
     CHROMA_PERSIST_DIR: str = str(Path(__file__).parent.parent / "chroma_db")
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
+    #: "tfidf" (default, low-memory) | "auto" (Ollama → SentenceTransformer)
+    #: | "onnx" (ONNX Runtime — CUDA if available, else int8 CPU; needs
+    #: ``optimum[onnxruntime]``).
+    EMBEDDING_BACKEND: str = "tfidf"
+    #: Shard large SentenceTransformer batches across CPU worker processes.
+    #: Each worker holds its own model copy — leave off on small instances.
+    EMBEDDING_MULTI_PROCESS: bool = False
+    #: Element type of the memory-mapped search matrix: "float16" | "int8".
+    #: int8 halves its RAM/disk footprint again at a small recall cost.
+    VECTOR_MATRIX_DTYPE: str = "float16"
 
     # ── Token limits ──────────────────────────────────────────────────────────
     MAX_TOKENS_CAREER_ADVICE: int = 2000
@@ -6,7 +6,9 @@ from __future__ import annotations
 
 import logging
 import os
+import time
 from contextlib import asynccontextmanager
+from typing import Any, Dict, Tuple
 
 from fastapi import FastAPI, Request, HTTPException, Security
 from fastapi.middleware.cors import CORSMiddleware
@@ -82,6 +84,13 @@ async def lifespan(app: FastAPI):
     yield
     logger.info("👋 Career Genie AI shutting down")
 
+    try:
+        from backend.services.vector_store import vector_store
+        if vector_store is not None:
+            vector_store.close()
+    except Exception as e:
+        logger.warning(f"⚠️  Vector store shutdown: {e}")
+
 
 # ── App ───────────────────────────────────────────────────────────────────────
 
@@ -218,9 +227,14 @@ async def root():
     }
 
 
-@app.get("/health")
-async def health():
-    """Health check — verifies LLM availability; vector store issues are non-critical."""
+# Probes and monitoring hit /health every few seconds; keep the last result
+# for a short TTL so each poll doesn't re-open every subsystem.
+_HEALTH_TTL_SECONDS = 5.0
+_health_cache: Dict[str, Any] = {"expires": 0.0, "value": None}
+
+
+def _compute_health() -> Tuple[int, Dict]:
+    """Return (status_code, body) for the health endpoint."""
     warnings = []
 
     # Vector store — degraded warning only, does NOT block healthy status
@@ -245,12 +259,23 @@ async def health():
             llm_ok = False
 
     if not llm_ok:
-        return JSONResponse(
-            status_code=503,
-            content={"status": "degraded", "version": "3.2.0", "warnings": warnings, "issues": ["llm: no providers available"]},
-        )
+        return 503, {"status": "degraded", "version": "3.2.0", "warnings": warnings, "issues": ["llm: no providers available"]}
+
+    return 200, {"status": "healthy", "version": "3.2.0", "warnings": warnings}
 
-    return {"status": "healthy", "version": "3.2.0", "warnings": warnings}
+
+@app.get("/health")
+async def health():
+    """Health check — verifies LLM availability; vector store issues are non-critical."""
+    now = time.monotonic()
+    if _health_cache["value"] is None or now >= _health_cache["expires"]:
+        _health_cache["value"] = _compute_health()
+        _health_cache["expires"] = now + _HEALTH_TTL_SECONDS
+
+    status_code, body = _health_cache["value"]
+    if status_code != 200:
+        return JSONResponse(status_code=status_code, content=body)
+    return body
 
 
 # ── Entry point ───────────────────────────────────────────────────────────────
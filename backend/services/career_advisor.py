@@ -14,6 +14,7 @@ Refactored to:
 from __future__ import annotations
 
 import re
+from types import MappingProxyType
 from typing import Dict, List, Optional
 
 from backend.core import ai_pipeline
@@ -24,6 +25,84 @@ from backend.core.prompts import Prompts
 
 logger = get_logger("career_advisor")
 
+# Identical advice prompts (same resume, roles and context blocks) within this
+# window reuse the previous response instead of another multi-second LLM call.
+_ADVICE_CACHE_TTL = 900  # 15 minutes
+
+# Section headers of Prompts.career_advice ("2. CRITICAL SKILL GAPS:"), with
+# optional numbering / markdown decoration.  A header ends in a colon (text
+# after it belongs to the section body) or at end of line, so body text
+# that merely starts with a section phrase is not split off as a header.
+_SECTION_RE = re.compile(
+    r"(?im)^[ \t#*]*(?:\d+[.)][ \t]*)?[*#]*[ \t]*"
+    r"(current assessment|critical skill gaps?|skill gaps?|market insights?|action plan)"
+    r"(?:[ \t*]*:[ \t*]*|[ \t*]*$)"
+)
+_SECTION_KEYS = {
+    "current":  "assessment",
+    "critical": "skills",
+    "skill":    "skills",
+    "market":   "market",
+    "action":   "actions",
+}
+_WORD_RE = re.compile(r"\w+")
+_GAP_BULLET_RE = re.compile(r"^[-•*\s]+")
+_ACTION_BULLET_RE = re.compile(r"^[-•*\d.)\s]+")
+
+# Static career ladder — built once, read-only.
+_CAREER_STAGES = (
+    MappingProxyType({
+        "role": "Entry Level", "timeline": "0–2 years",
+        "key_skills_needed": ("Core technical skills", "Communication", "Problem-solving"),
+        "typical_responsibilities": ("Learn and contribute", "Complete assigned tasks"),
+    }),
+    MappingProxyType({
+        "role": "Mid Level", "timeline": "2–5 years",
+        "key_skills_needed": ("Advanced skills", "Project ownership", "Mentoring"),
+        "typical_responsibilities": ("Lead small projects", "Mentor juniors"),
+    }),
+    MappingProxyType({
+        "role": "Senior Level", "timeline": "5+ years",
+        "key_skills_needed": ("Architecture", "Leadership", "Strategy"),
+        "typical_responsibilities": ("Design systems", "Guide team direction"),
+    }),
+)
+
+# Curated learning resources for _build_learning_path, keyed by canonical skill
+_RESOURCE_DB: Dict[str, List[Dict]] = {
+    "python": [{"title": "Python for Everybody", "type": "Course",
+                "url": "https://coursera.org/specializations/python",
+                "duration": "4 months", "difficulty": "Beginner"}],
+    "machine learning": [{"title": "ML by Andrew Ng", "type": "Course",
+                           "url": "https://coursera.org/learn/machine-learning",
+                           "duration": "11 weeks", "difficulty": "Intermediate"}],
+    "system design": [{"title": "Grokking System Design", "type": "Course",
+                        "url": "https://educative.io/courses/grokking-the-system-design-interview",
+                        "duration": "8 weeks", "difficulty": "Advanced"}],
+    "docker": [{"title": "Docker Official Docs", "type": "Docs",
+                "url": "https://docs.docker.com/get-started/",
+                "duration": "3 hours", "difficulty": "Beginner"}],
+    "react": [{"title": "React – The Complete Guide", "type": "Course",
+               "url": "https://udemy.com/course/react-the-complete-guide/",
+               "duration": "40 hours", "difficulty": "Intermediate"}],
+}
+# Alternate spellings → canonical _RESOURCE_DB key
+_RESOURCE_ALIASES: Dict[str, str] = {
+    **{key: key for key in _RESOURCE_DB},
+    "python3":             "python",
+    "ml":                  "machine learning",
+    "deep learning":       "machine learning",
+    "distributed systems": "system design",
+    "containers":          "docker",
+    "containerization":    "docker",
+    "react.js":            "react",
+    "reactjs":             "react",
+}
+# Every alias in one pass; the longest hit in a gap name wins
+_RESOURCE_KEY_RE = re.compile(
+    r"\b(" + "|".join(re.escape(a) for a in sorted(_RESOURCE_ALIASES, key=len, reverse=True)) + r")"
+)
+
 
 class CareerAdvisor:
     """
@@ -35,6 +114,19 @@ class CareerAdvisor:
       - User profile / behaviour signals (personalisation)
     """
 
+    def __init__(self) -> None:
+        # Plain-word skills ("python", "go") are found by one tokenisation
+        # pass plus set intersection — identical to a \bskill\b search.
+        # The rest ("c++", "node.js", "machine learning") share one compiled
+        # alternation; the lookahead reports a hit at every word boundary.
+        skills_lower = {s.lower(): s for s in settings.TECH_SKILLS}
+        self._word_skills = {k: v for k, v in skills_lower.items() if _WORD_RE.fullmatch(k)}
+        self._phrase_skills = {k: v for k, v in skills_lower.items() if k not in self._word_skills}
+        phrases = sorted(self._phrase_skills, key=len, reverse=True)
+        self._phrase_re = re.compile(
+            r"\b(?=(" + "|".join(re.escape(p) for p in phrases) + r")\b)"
+        ) if phrases else None
+
     def generate_career_advice(
         self,
         resume_text: str,
@@ -80,10 +172,13 @@ class CareerAdvisor:
 
     def _extract_skills(self, resume_text: str) -> List[str]:
         text_lower = resume_text.lower()
-        return sorted(
-            s for s in settings.TECH_SKILLS
-            if re.search(r"\b" + re.escape(s.lower()) + r"\b", text_lower)
-        )
+        found = {
+            self._word_skills[t]
+            for t in set(_WORD_RE.findall(text_lower)) if t in self._word_skills
+        }
+        if self._phrase_re is not None:
+            found.update(self._phrase_skills[m.group(1)] for m in self._phrase_re.finditer(text_lower))
+        return sorted(found)
 
     def _build_context_blocks(
         self,
@@ -165,7 +260,8 @@ class CareerAdvisor:
                 system, user,
                 temp=0.7,
                 max_tokens=settings.MAX_TOKENS_CAREER_ADVICE,
-                use_cache=False,  # career advice should always be fresh
+                use_cache=True,
+                cache_ttl=_ADVICE_CACHE_TTL,
             )
             return self._parse_response(raw.strip(), current_skills)
         except LLMUnavailableError as exc:
@@ -176,62 +272,48 @@ class CareerAdvisor:
             return self._fallback_advice(current_skills, target_role)
 
     def _parse_response(self, text: str, current_skills: List[str]) -> Dict:
-        lines = text.split("\n")
         assessment, skill_gaps, market_insights, action_plan = "", [], "", []
-        section = None
-
-        for line in lines:
-            line = line.strip()
-            if not line:
-                continue
-            ll = line.lower()
-            if "current assessment" in ll or ll.startswith("1."):
-                section = "assessment"
-                continue
-            elif "skill gap" in ll or "critical skill" in ll or ll.startswith("2."):
-                section = "skills"
-                continue
-            elif "market insight" in ll or ll.startswith("3."):
-                section = "market"
-                continue
-            elif "action plan" in ll or ll.startswith("4."):
-                section = "actions"
-                continue
-
-            if line.startswith(("**", "#")):
-                continue
-
-            if section == "assessment" and not line.startswith("-") and len(line) > 10:
-                assessment += line + " "
-            elif section == "skills" and line.startswith("-"):
-                parts = re.sub(r"^[-•*\s]+", "", line).split("|")
-                skill_name    = parts[0].strip()
-                importance    = "Critical"
-                current_level = "None"
-                target_level  = "Intermediate"
-                for p in parts[1:]:
-                    p = p.strip()
-                    if p.lower().startswith("importance"):
-                        importance    = p.split(":")[-1].strip()
-                    elif p.lower().startswith("current"):
-                        current_level = p.split(":")[-1].strip()
-                    elif p.lower().startswith("target"):
-                        target_level  = p.split(":")[-1].strip()
-                if skill_name and len(skill_name) > 2:
-                    skill_gaps.append({
-                        "skill":         skill_name,
-                        "importance":    importance,
-                        "current_level": current_level,
-                        "target_level":  target_level,
-                    })
-            elif section == "market" and not line.startswith("-") and len(line) > 10:
-                market_insights += line + " "
-            elif section == "actions" and (
-                line.startswith("-") or (line[0].isdigit() and "." in line[:3])
-            ):
-                action = re.sub(r"^[-•*\d.)\s]+", "", line).strip()
-                if action and len(action) > 5:
-                    action_plan.append(action)
+
+        # [preamble, header, body, header, body, ...]
+        parts = _SECTION_RE.split(text)
+        for header, body in zip(parts[1::2], parts[2::2]):
+            section = _SECTION_KEYS[header.lower().split()[0]]
+            for line in body.split("\n"):
+                line = line.strip()
+                if not line or line.startswith(("**", "#")):
+                    continue
+
+                if section == "assessment" and not line.startswith("-") and len(line) > 10:
+                    assessment += line + " "
+                elif section == "skills" and line.startswith("-"):
+                    fields = _GAP_BULLET_RE.sub("", line).split("|")
+                    skill_name    = fields[0].strip()
+                    importance    = "Critical"
+                    current_level = "None"
+                    target_level  = "Intermediate"
+                    for p in fields[1:]:
+                        p = p.strip()
+                        if p.lower().startswith("importance"):
+                            importance    = p.split(":")[-1].strip()
+                        elif p.lower().startswith("current"):
+                            current_level = p.split(":")[-1].strip()
+                        elif p.lower().startswith("target"):
+                            target_level  = p.split(":")[-1].strip()
+                    if skill_name and len(skill_name) > 2:
+                        skill_gaps.append({
+                            "skill":         skill_name,
+                            "importance":    importance,
+                            "current_level": current_level,
+                            "target_level":  target_level,
+                        })
+                elif section == "market" and not line.startswith("-") and len(line) > 10:
+                    market_insights += line + " "
+                elif section == "actions" and (
+                    line.startswith("-") or (line[0].isdigit() and "." in line[:3])
+                ):
+                    action = _ACTION_BULLET_RE.sub("", line).strip()
+                    if action and len(action) > 5:
+                        action_plan.append(action)
 
         return {
             "assessment": assessment.strip()
@@ -277,30 +359,12 @@ class CareerAdvisor:
 
     def _build_learning_path(self, skill_gaps: List[Dict]) -> List[Dict]:
         """Build a curated resource list from skill gaps."""
-        _resource_db: Dict[str, List[Dict]] = {
-            "python": [{"title": "Python for Everybody", "type": "Course",
-                        "url": "https://coursera.org/specializations/python",
-                        "duration": "4 months", "difficulty": "Beginner"}],
-            "machine learning": [{"title": "ML by Andrew Ng", "type": "Course",
-                                   "url": "https://coursera.org/learn/machine-learning",
-                                   "duration": "11 weeks", "difficulty": "Intermediate"}],
-            "system design": [{"title": "Grokking System Design", "type": "Course",
-                                "url": "https://educative.io/courses/grokking-the-system-design-interview",
-                                "duration": "8 weeks", "difficulty": "Advanced"}],
-            "docker": [{"title": "Docker Official Docs", "type": "Docs",
-                        "url": "https://docs.docker.com/get-started/",
-                        "duration": "3 hours", "difficulty": "Beginner"}],
-            "react": [{"title": "React – The Complete Guide", "type": "Course",
-                       "url": "https://udemy.com/course/react-the-complete-guide/",
-                       "duration": "40 hours", "difficulty": "Intermediate"}],
-        }
         resources: List[Dict] = []
         for gap in skill_gaps[:5]:
             skill = gap.get("skill", "").lower()
-            for key, res_list in _resource_db.items():
-                if key in skill or skill in key:
-                    resources.extend(res_list)
-                    break
+            hits = _RESOURCE_KEY_RE.findall(skill)
+            if hits:
+                resources.extend(_RESOURCE_DB[_RESOURCE_ALIASES[max(hits, key=len)]])
             else:
                 q = skill.replace(" ", "+")
                 resources.append({
@@ -314,17 +378,8 @@ class CareerAdvisor:
 
     @staticmethod
     def _career_stages() -> List[Dict]:
-        return [
-            {"role": "Entry Level", "timeline": "0–2 years",
-             "key_skills_needed": ["Core technical skills", "Communication", "Problem-solving"],
-             "typical_responsibilities": ["Learn and contribute", "Complete assigned tasks"]},
-            {"role": "Mid Level", "timeline": "2–5 years",
-             "key_skills_needed": ["Advanced skills", "Project ownership", "Mentoring"],
-             "typical_responsibilities": ["Lead small projects", "Mentor juniors"]},
-            {"role": "Senior Level", "timeline": "5+ years",
-             "key_skills_needed": ["Architecture", "Leadership", "Strategy"],
-             "typical_responsibilities": ["Design systems", "Guide team direction"]},
-        ]
+        # Shallow copies: callers get their own dicts, the lists stay shared tuples.
+        return [dict(stage) for stage in _CAREER_STAGES]
 
 
 # ── Singleton ─────────────────────────────────────────────────────────────────
@@ -1,6 +1,17 @@
 import re
+import hashlib
+import threading
 from typing import List, Dict, Set
-from collections import defaultdict
+from collections import defaultdict, OrderedDict
+
+# Proficiency level -> ordinal; unknown levels rank as "intermediate"
+_PROFICIENCY_SCORES = {"beginner" : 1, "intermediate" : 2, "proficient" : 3, "expert" : 4}
+
+# Recent extraction results kept per extractor, keyed by a hash of the text
+_RESULT_CACHE_SIZE = 256
+
+# Only the first 50k characters are scanned; bounds work on pasted dumps
+_MAX_TEXT_CHARS = 50_000
 
 
 class EnhancedSkillExtractor :
@@ -26,30 +37,86 @@ class EnhancedSkillExtractor :
             "beginner" : ["basic", "beginner", "learning", "exposure to"]
         }
 
+        # One alternation over every variation, longest first so "node.js"
+        # wins over "js" at the same position.  The lookahead lets a single
+        # finditer pass report a hit at every word boundary (so "js" inside
+        # "node.js" is still seen) instead of one regex scan per variation.
+        variations = sorted(
+            {v for vs in self.skill_db.values() for v in vs}, key=len, reverse=True
+        )
+        self._variation_re = re.compile(
+            r'\b(?=(' + "|".join( re.escape( v ) for v in variations ) + r')\b)'
+        )
+
+        # Proficiency keywords (substring match, listed in level priority
+        # order) and the "5+ years" count, found in one scan of the context.
+        # Only the year digits are consumed, so no keyword is hidden by a match.
+        self._keyword_level = {
+            kw : level for level, keywords in self.experience_keywords.items() for kw in keywords
+        }
+        self._prof_years_re = re.compile(
+            r'(?=(?P<kw>' + "|".join( re.escape( kw ) for kw in self._keyword_level ) + r'))'
+            r'|(?P<yrs>\d+)(?=\+?\s*(?:-\s*\d+\s*)?years?)'
+        )
+        self._level_rank = {level : rank for rank, level in enumerate( self.experience_keywords )}
+
+        # The same resume is typically extracted by /match, /roadmap and
+        # /insights in turn; remember recent results instead of rescanning
+        self._result_cache = OrderedDict()
+        self._result_cache_lock = threading.Lock()
+
     def extract_skills_with_context ( self, text: str ) -> List[Dict] :
         """Extract skills with proficiency levels and context"""
+        if not text :
+            return []
+        text = text[:_MAX_TEXT_CHARS]
+
+        key = hashlib.blake2b( text.encode( "utf-8", "surrogatepass" ), digest_size=16 ).digest()
+        with self._result_cache_lock :
+            cached = self._result_cache.get( key )
+            if cached is not None :
+                self._result_cache.move_to_end( key )
+        if cached is None :
+            cached = tuple( self._extract_skills_with_context( text ) )
+            with self._result_cache_lock :
+                self._result_cache[key] = cached
+                if len( self._result_cache ) > _RESULT_CACHE_SIZE :
+                    self._result_cache.popitem( last=False )
+
+        # Callers get their own dicts, so mutating a result can't poison the cache
+        return [dict( skill ) for skill in cached]
+
+    def _extract_skills_with_context ( self, text: str ) -> List[Dict] :
         text_lower = text.lower()
         skills_found = []
 
-        # Extract skills with surrounding context
+        # Single pass: first occurrence of every variation
+        first_hit = {}
+        for match in self._variation_re.finditer( text_lower ) :
+            variation = match.group( 1 )
+            if variation not in first_hit :
+                first_hit[variation] = match.start()
+
+        # Extract skills with surrounding context (same line, up to 50 chars)
         for skill_category, variations in self.skill_db.items() :
             for variation in variations :
-                pattern = rf'(.{{0,50}})\b{re.escape( variation )}\b(.{{0,50}})'
-                matches = re.finditer( pattern, text_lower, re.IGNORECASE )
-
-                for match in matches :
-                    context = match.group( 1 ) + match.group( 0 ) + match.group( 2 )
-                    proficiency = self._detect_proficiency( context )
-                    years = self._extract_years( context )
-
-                    skills_found.append( {
-                        "skill" : skill_category,
-                        "variation" : variation,
-                        "proficiency" : proficiency,
-                        "years_experience" : years,
-                        "context" : context.strip()
-                    } )
-                    break  # Found this skill, move to next
+                start = first_hit.get( variation )
+                if start is None :
+                    continue
+
+                end = start + len( variation )
+                before = text_lower[max( 0, start - 50 ):start].rsplit( "\n", 1 )[-1]
+                after = text_lower[end:end + 50].split( "\n", 1 )[0]
+                context = before + variation + after
+                proficiency, years = self._detect_proficiency_and_years( context )
+
+                skills_found.append( {
+                    "skill" : skill_category,
+                    "variation" : variation,
+                    "proficiency" : proficiency,
+                    "years_experience" : years,
+                    "context" : context.strip()
+                } )
 
         # Deduplicate by skill category
         unique_skills = {}
@@ -65,30 +132,24 @@ class EnhancedSkillExtractor :
 
         return list( unique_skills.values() )
 
-    def _detect_proficiency ( self, context: str ) -> str :
-        """Detect proficiency level from context"""
-        context_lower = context.lower()
-
-        for level, keywords in self.experience_keywords.items() :
-            if any( kw in context_lower for kw in keywords ) :
-                return level
-
-        return "intermediate"  # Default
-
-    def _extract_years ( self, context: str ) -> int :
-        """Extract years of experience from context"""
-        # Pattern: "5 years", "5+ years", "5-7 years"
-        year_pattern = r'(\d+)\+?\s*(?:-\s*\d+\s*)?years?'
-        match = re.search( year_pattern, context.lower() )
-
-        if match :
-            return int( match.group( 1 ) )
-        return 0
+    def _detect_proficiency_and_years ( self, context: str ) -> tuple :
+        """Detect proficiency level and years of experience from context"""
+        # Years pattern: "5 years", "5+ years", "5-7 years"
+        level, years = None, None
+        for match in self._prof_years_re.finditer( context.lower() ) :
+            keyword = match.group( "kw" )
+            if keyword is not None :
+                found = self._keyword_level[keyword]
+                if level is None or self._level_rank[found] < self._level_rank[level] :
+                    level = found
+            elif years is None :
+                years = int( match.group( "yrs" ) )
+
+        return level or "intermediate", years or 0
 
     def _proficiency_score ( self, proficiency: str ) -> int :
         """Convert proficiency to numeric score"""
-        scores = {"beginner" : 1, "intermediate" : 2, "proficient" : 3, "expert" : 4}
-        return scores.get( proficiency, 2 )
+        return _PROFICIENCY_SCORES.get( proficiency, 2 )
 
     def compare_skills ( self, resume_skills: List[Dict], job_skills: List[Dict] ) -> Dict :
         """Compare resume skills with job requirements"""
@@ -99,12 +160,14 @@ class EnhancedSkillExtractor :
         gaps = []
         overqualified = []
 
+        score = _PROFICIENCY_SCORES.get
+
         # Check each job requirement
         for skill_name, job_skill in job_skill_map.items() :
-            if skill_name in resume_skill_map :
-                resume_skill = resume_skill_map[skill_name]
-                resume_score = self._proficiency_score( resume_skill["proficiency"] )
-                job_score = self._proficiency_score( job_skill["proficiency"] )
+            resume_skill = resume_skill_map.get( skill_name )
+            if resume_skill is not None :
+                resume_score = score( resume_skill["proficiency"], 2 )
+                job_score = score( job_skill["proficiency"], 2 )
 
                 if resume_score >= job_score :
                     matched.append( {
@@ -151,6 +214,17 @@ class EnhancedSkillExtractor :
         }
 
 
+# Singleton instance (the compiled alternations are built once per process)
+_skill_extractor = None
+
+
+def get_skill_extractor () -> EnhancedSkillExtractor :
+    global _skill_extractor
+    if _skill_extractor is None :
+        _skill_extractor = EnhancedSkillExtractor()
+    return _skill_extractor
+
+
 # Usage Example
 if __name__ == "__main__" :
     extractor = EnhancedSkillExtractor()
@@ -2,6 +2,37 @@ from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import re
 
+# Relative "posted_at" strings ("3 days ago"), compiled once and shared
+# with job_scraper.  ASCII digits only: \d would also match digits that
+# the callers' int() conversions aren't meant to see.
+_DAYS_RE = re.compile( r'([0-9]+)\s*day' )
+_WEEKS_RE = re.compile( r'([0-9]+)\s*week' )
+_MONTHS_RE = re.compile( r'([0-9]+)\s*month' )
+
+
+def _score (
+        keyword_delta: float,
+        description_length: int,
+        company_legit: bool,
+        has_apply_link: bool
+) -> float :
+    """Combine the extracted quality signals into a 0-10 score"""
+    score = 5.0 + keyword_delta  # Base score plus keyword penalties/rewards
+
+    # Reward detailed job descriptions
+    if description_length > 500 :
+        score += 1.0
+    elif description_length < 100 :
+        score -= 1.0
+
+    if company_legit :
+        score += 0.5
+
+    if has_apply_link :
+        score += 0.5
+
+    return max( 0, min( 10, score ) )
+
 
 class SmartJobFilter :
     """Filter jobs based on user preferences and quality signals"""
@@ -20,11 +51,30 @@ class SmartJobFilter :
             "remote option", "hybrid", "career growth", "training provided"
         ]
 
-        # Experience level patterns
+        # Both keyword lists in one pass: keyword -> score delta.  The
+        # lookahead reports matches at every offset, so overlapping keywords
+        # are all seen, like the per-keyword substring tests were.
+        self._keyword_weights = {
+            **{flag : -2.0 for flag in self.red_flags},
+            **{indicator : 0.5 for indicator in self.quality_indicators}
+        }
+        self._keyword_re = re.compile(
+            r'(?=(' + "|".join(
+                re.escape( kw ) for kw in sorted( self._keyword_weights, key=len, reverse=True )
+            ) + r'))'
+        )
+
+        # Remote keywords, substring match in one scan
+        self._remote_re = re.compile( r'remote|work from home|wfh|anywhere' )
+
+        # Experience level patterns (compiled once).  Every caller searches
+        # lowercased text, so no IGNORECASE case folding per character.
         self.experience_patterns = {
-            "entry" : r'\b(entry.?level|junior|0-2\s*years?|fresh|graduate)\b',
-            "mid" : r'\b(mid.?level|intermediate|2-5\s*years?|3-5\s*years?)\b',
-            "senior" : r'\b(senior|lead|5\+?\s*years?|7\+?\s*years?|expert)\b'
+            level : re.compile( pattern ) for level, pattern in {
+                "entry" : r'\b(?:entry.?level|junior|0-2\s*years?|fresh|graduate)\b',
+                "mid" : r'\b(?:mid.?level|intermediate|2-5\s*years?|3-5\s*years?)\b',
+                "senior" : r'\b(?:senior|lead|5\+?\s*years?|7\+?\s*years?|expert)\b'
+            }.items()
         }
 
     def filter_jobs (
@@ -40,31 +90,40 @@ class SmartJobFilter :
 
         filtered = []
 
-        for job in jobs :
-            # Skip if below minimum match score
-            if job.get( 'match_score', 0 ) < min_match_score :
-                continue
-
-            # Calculate quality score
-            quality = self._calculate_quality_score( job )
-            if quality < min_quality_score :
-                continue
+        # Resolve the experience pattern once instead of per job
+        experience_pattern = None
+        if experience_level :
+            experience_pattern = self.experience_patterns.get( experience_level.lower() )
 
-            # Filter by experience level
-            if experience_level :
-                if not self._matches_experience_level( job, experience_level ) :
-                    continue
+        # Threshold match score in one comprehension pass before the
+        # per-job predicates run
+        candidates = [job for job in jobs if job.get( 'match_score', 0 ) >= min_match_score]
 
+        # Cheapest predicates first: quality scoring (the keyword scan) only
+        # runs for jobs that survived every other filter
+        for job in candidates :
             # Filter by posting date
             if posted_within_days :
                 if not self._is_recent( job, posted_within_days ) :
                     continue
 
+            text = self._lowered_text( job )
+
             # Filter remote/on-site
             if exclude_remote :
-                if self._is_remote( job ) :
+                if self._is_remote( text ) :
+                    continue
+
+            # Filter by experience level (unknown level: don't filter)
+            if experience_pattern is not None :
+                if not experience_pattern.search( text['title_description'] ) :
                     continue
 
+            # Calculate quality score
+            quality = self._calculate_quality_score( job, text )
+            if quality < min_quality_score :
+                continue
+
             # Add quality score to job
             job['quality_score'] = quality
             filtered.append( job )
@@ -77,51 +136,31 @@ class SmartJobFilter :
 
         return filtered
 
-    def _calculate_quality_score ( self, job: Dict ) -> float :
-        """Calculate job quality score (0-10)"""
-        score = 5.0  # Base score
-
-        title = job.get( 'title', '' ).lower()
-        description = job.get( 'description', '' ).lower()
-        company = job.get( 'company', '' ).lower()
-
-        full_text = f"{title} {description} {company}"
-
-        # Penalize red flags
-        red_flag_count = sum( 1 for flag in self.red_flags if flag in full_text )
-        score -= red_flag_count * 2
-
-        # Reward quality indicators
-        quality_count = sum( 1 for indicator in self.quality_indicators if indicator in full_text )
-        score += quality_count * 0.5
-
-        # Reward detailed job descriptions
-        if len( description ) > 500 :
-            score += 1.0
-        elif len( description ) < 100 :
-            score -= 1.0
-
-        # Check if company name looks legitimate
-        if company and len( company ) > 3 and not any( char.isdigit() for char in company ) :
-            score += 0.5
-
-        # Has apply link
-        if job.get( 'apply_link' ) :
-            score += 0.5
-
-        return max( 0, min( 10, score ) )
-
-    def _matches_experience_level ( self, job: Dict, target_level: str ) -> bool :
-        """Check if job matches target experience level"""
-        title = job.get( 'title', '' ).lower()
+    def _lowered_text ( self, job: Dict ) -> Dict[str, str] :
+        """Lowercase the job's text fields once for all the predicates"""
         description = job.get( 'description', '' ).lower()
-        full_text = f"{title} {description}"
-
-        pattern = self.experience_patterns.get( target_level.lower() )
-        if not pattern :
-            return True  # Unknown level, don't filter
+        return {
+            'title_description' : f"{job.get( 'title', '' ).lower()} {description}",
+            'description' : description,
+            'company' : job.get( 'company', '' ).lower(),
+            'location' : job.get( 'location', '' ).lower()
+        }
 
-        return bool( re.search( pattern, full_text, re.IGNORECASE ) )
+    def _calculate_quality_score ( self, job: Dict, text: Dict[str, str] ) -> float :
+        """Calculate job quality score (0-10)"""
+        company = text['company']
+        full_text = f"{text['title_description']} {company}"
+
+        # Penalize red flags / reward quality indicators (each counted once)
+        hits = {match.group( 1 ) for match in self._keyword_re.finditer( full_text )}
+
+        return _score(
+            keyword_delta=sum( self._keyword_weights[kw] for kw in hits ),
+            description_length=len( text['description'] ),
+            # Check if company name looks legitimate
+            company_legit=len( company ) > 3 and not any( char.isdigit() for char in company ),
+            has_apply_link=bool( job.get( 'apply_link' ) )
+        )
 
     def _is_recent ( self, job: Dict, max_days: int ) -> bool :
         """Check if job was posted within max_days"""
@@ -132,7 +171,7 @@ class SmartJobFilter :
 
         # Parse relative dates
         if 'day' in posted_at :
-            match = re.search( r'(\d+)\s*day', posted_at )
+            match = _DAYS_RE.search( posted_at )
             if match :
                 days_ago = int( match.group( 1 ) )
                 return days_ago <= max_days
@@ -141,27 +180,23 @@ class SmartJobFilter :
             return True  # Posted today
 
         if 'week' in posted_at :
-            match = re.search( r'(\d+)\s*week', posted_at )
+            match = _WEEKS_RE.search( posted_at )
             if match :
                 weeks_ago = int( match.group( 1 ) )
                 return (weeks_ago * 7) <= max_days
 
         if 'month' in posted_at :
-            match = re.search( r'(\d+)\s*month', posted_at )
+            match = _MONTHS_RE.search( posted_at )
             if match :
                 months_ago = int( match.group( 1 ) )
                 return (months_ago * 30) <= max_days
 
         return True  # Can't parse, include by default
 
-    def _is_remote ( self, job: Dict ) -> bool :
-        """Check if job is remote"""
-        location = job.get( 'location', '' ).lower()
-        description = job.get( 'description', '' ).lower()
-
-        remote_keywords = ['remote', 'work from home', 'wfh', 'anywhere']
-
-        return any( keyword in location or keyword in description for keyword in remote_keywords )
+    def _is_remote ( self, text: Dict[str, str] ) -> bool :
+        """Check if job is remote (takes the job's _lowered_text)"""
+        # Newline separator: no keyword can match across the two fields
+        return bool( self._remote_re.search( f"{text['location']}\n{text['description']}" ) )
 
     def get_filter_stats ( self, jobs: List[Dict] ) -> Dict :
         """Get statistics about job filtering"""
@@ -172,12 +207,14 @@ class SmartJobFilter :
         quality_distribution = {'high' : 0, 'medium' : 0, 'low' : 0}
 
         for job in jobs :
+            text = self._lowered_text( job )
+
             # Count experience levels
-            title_desc = f"{job.get( 'title', '' )} {job.get( 'description', '' )}".lower()
+            title_desc = text['title_description']
 
             level_found = False
             for level, pattern in self.experience_patterns.items() :
-                if re.search( pattern, title_desc, re.IGNORECASE ) :
+                if pattern.search( title_desc ) :
                     experience_levels[level] += 1
                     level_found = True
                     break
@@ -186,11 +223,11 @@ class SmartJobFilter :
                 experience_levels['unknown'] += 1
 
             # Count remote
-            if self._is_remote( job ) :
+            if self._is_remote( text ) :
                 remote_count += 1
 
             # Quality distribution
-            quality = self._calculate_quality_score( job )
+            quality = self._calculate_quality_score( job, text )
             if quality >= 7 :
                 quality_distribution['high'] += 1
             elif quality >= 5 :
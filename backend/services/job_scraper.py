@@ -1,22 +1,25 @@
 from typing import List, Dict, Optional
 import logging
 from datetime import datetime
-import re
 import time
 import hashlib
 
+import httpx
+
 from backend.core.config import settings
+from backend.services.job_filter import _DAYS_RE, _WEEKS_RE, _MONTHS_RE
 
 # Initialize logger first
 logger = logging.getLogger( __name__ )
 
-# Try importing serpapi Client (v1.x API)
+# orjson parses the SerpAPI payload several times faster than the stdlib
 try :
-    from serpapi import Client as SerpApiClient
-    logger.info( "serpapi Client imported successfully" )
-except Exception as e :
-    logger.error( "serpapi import failed: %s", e )
-    SerpApiClient = None
+    from orjson import loads as _json_loads
+except ImportError :
+    from json import loads as _json_loads
+
+_SERPAPI_URL = "https://serpapi.com/search.json"
+_SERPAPI_TIMEOUT = 30.0
 
 # Simple cache to prevent duplicate requests
 _search_cache = {}
@@ -37,8 +40,8 @@ class JobScraper :
             )
 
     def _get_cache_key ( self, query: str, location: str, days_old: int ) -> str :
-        raw = f"{query}|{location}|{days_old}"
-        return hashlib.md5( raw.encode() ).hexdigest()
+        raw = f"{query}\x00{location}\x00{days_old}"
+        return hashlib.blake2b( raw.encode(), digest_size=16 ).hexdigest()
 
     def _get_mock_jobs (
             self,
@@ -116,7 +119,10 @@ class JobScraper :
             role = roles[i % len( roles )]
             company = companies[i % len( companies )]
             loc = locations[i % len( locations )]
-            job_id = f"mock_job_{int( time.time() )}_{i}"
+            # Content-derived id, stable across calls and restarts, so
+            # re-indexing the same mock job is a true upsert
+            id_source = f"{role}\x00{company}\x00{loc}".lower().strip()
+            job_id = "mock_job_" + hashlib.blake2b( id_source.encode(), digest_size=10 ).hexdigest()
 
             # Rotate which skills appear in this job so matches vary naturally
             job_skills_subset = combined_skills[i % max( 1, len( combined_skills ) - 2 ) :]
@@ -179,24 +185,28 @@ class JobScraper :
             return jobs
 
         try :
-            if SerpApiClient is None :
-                raise ImportError( "serpapi package not installed. Run: pip install serpapi" )
-
             logger.info(
                 "Using API key: %s...",
                 self.api_key[:8] if self.api_key else "NONE"
             )
 
-            # serpapi v1.x uses Client + client.search()
-            client = SerpApiClient( api_key=self.api_key )
-            results = client.search( {
-                "engine" : "google_jobs",
-                "q" : f"{query} jobs",
-                "location" : location,
-                "gl" : "in",
-                "hl" : "en",
-                "num" : min( num_jobs, 100 ),
-            } )
+            # Plain HTTP GET; the raw body goes straight to orjson (when
+            # installed) instead of through the client library's json.loads
+            response = httpx.get(
+                _SERPAPI_URL,
+                params={
+                    "engine" : "google_jobs",
+                    "q" : f"{query} jobs",
+                    "location" : location,
+                    "gl" : "in",
+                    "hl" : "en",
+                    "num" : min( num_jobs, 100 ),
+                    "api_key" : self.api_key,
+                },
+                timeout=_SERPAPI_TIMEOUT,
+            )
+            response.raise_for_status()
+            results = _json_loads( response.content )
 
             jobs_results = results.get( "jobs_results", [] )
             logger.info( "Found %d jobs from SerpAPI", len( jobs_results ) )
@@ -218,8 +228,9 @@ class JobScraper :
                 if days_old is not None and days_old_calc > days_old :
                     continue
 
-                id_source = f"{title}|{company}|{job.get( 'location', '' )}".lower().strip()
-                job_id = "job_" + hashlib.md5( id_source.encode() ).hexdigest()[:20]
+                # NUL separators: "ab"+"c" and "a"+"bc" must not collide
+                id_source = f"{title}\x00{company}\x00{job.get( 'location', '' )}".lower().strip()
+                job_id = "job_" + hashlib.blake2b( id_source.encode(), digest_size=10 ).hexdigest()
 
                 job_data = {
                     "id" : job_id,
@@ -263,13 +274,13 @@ class JobScraper :
         if "hour" in posted_lower or "minute" in posted_lower or "just now" in posted_lower :
             return 0
         elif "day" in posted_lower :
-            m = re.search( r"(\d+)\s*day", posted_lower )
+            m = _DAYS_RE.search( posted_lower )
             return int( m.group( 1 ) ) if m else 1
         elif "week" in posted_lower :
-            m = re.search( r"(\d+)\s*week", posted_lower )
+            m = _WEEKS_RE.search( posted_lower )
             return int( m.group( 1 ) ) * 7 if m else 7
         elif "month" in posted_lower :
-            m = re.search( r"(\d+)\s*month", posted_lower )
+            m = _MONTHS_RE.search( posted_lower )
             return int( m.group( 1 ) ) * 30 if m else 30
         return 0
 
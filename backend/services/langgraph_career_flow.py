@@ -38,8 +38,8 @@ class CareerState(TypedDict):
 def node_parse_resume(state: CareerState) -> CareerState:
     """Extract skills from resume using EnhancedSkillExtractor."""
     try:
-        from backend.services.enhanced_skill_extractor import EnhancedSkillExtractor
-        extractor = EnhancedSkillExtractor()
+        from backend.services.enhanced_skill_extractor import get_skill_extractor
+        extractor = get_skill_extractor()
         raw    = extractor.extract_skills_with_context(state["resume_text"])
         skills = [s["skill"] for s in raw[:15]] if raw else ["Python", "Communication"]
         logger.info(f"[LangGraph] node_parse_resume → {len(skills)} skills")
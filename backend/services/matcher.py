@@ -13,26 +13,80 @@ Fixes applied:
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from backend.core import ai_pipeline
 from backend.core.logging import get_logger
 from backend.services.vector_store import vector_store
 
+try:
+    import re2 as _skill_re  # google-re2: linear-time DFA matching
+except ImportError:
+    _skill_re = re
+
 logger = get_logger("matcher")
 
+# Upper bound on concurrent LLM explanation calls per match request.  Kept
+# at half of ai_pipeline's provider concurrency cap (4), so one /match
+# can't take every slot from career advice, resume analysis and chat.
+_EXPLANATION_WORKERS = 2
+
+# Skills recognised by _extract_skills, matched as whole words in one pass
+SKILL_VOCAB = (
+    # Languages
+    "python", "java", "javascript", "typescript", "c++", "c#", "ruby", "go",
+    "rust", "php", "swift", "kotlin",
+    # Frameworks
+    "react", "angular", "vue", "django", "flask", "fastapi", "spring",
+    "express", "node.js", "nodejs",
+    # Databases
+    "sql", "mysql", "postgresql", "mongodb", "redis", "dynamodb", "oracle",
+    # Cloud / DevOps
+    "aws", "azure", "gcp", "docker", "kubernetes", "jenkins", "terraform",
+    "ansible",
+    # AI / ML
+    "machine learning", "deep learning", "tensorflow", "pytorch",
+    "scikit-learn", "nlp", "computer vision",
+    # Tools / process
+    "git", "jira", "confluence", "linux", "agile", "scrum",
+)
+
+# Title words and the resume terms that count as a partial title match
+_TITLE_WORD_RE = re.compile(r'\b[a-z]+\b')
+_TITLE_VARIATIONS = {
+    "engineer":  ("engineer", "developer", "programmer", "architect"),
+    "developer": ("developer", "engineer", "programmer", "coder"),
+    "senior":    ("senior", "lead", "principal", "staff"),
+    "junior":    ("junior", "entry", "fresher", "graduate"),
+    "data":      ("data", "analytics", "analyst", "scientist"),
+    "cloud":     ("cloud", "aws", "azure", "gcp"),
+    "frontend":  ("frontend", "front-end", "ui", "react", "vue", "angular"),
+    "backend":   ("backend", "back-end", "api", "server"),
+    "fullstack": ("fullstack", "full-stack", "full stack"),
+}
+
+
+def _compile_skill_pattern(pattern: str):
+    """Compile with re2 when installed, falling back to ``re`` per pattern."""
+    try:
+        return _skill_re.compile(pattern)
+    except Exception:
+        return re.compile(pattern)
+
 
 class JobMatcher:
     def __init__(self):
-        self.skill_patterns = [
-            r'\b(python|java|javascript|typescript|c\+\+|c#|ruby|go|rust|php|swift|kotlin)\b',
-            r'\b(react|angular|vue|django|flask|fastapi|spring|express|node\.?js)\b',
-            r'\b(sql|mysql|postgresql|mongodb|redis|dynamodb|oracle)\b',
-            r'\b(aws|azure|gcp|docker|kubernetes|jenkins|terraform|ansible)\b',
-            r'\b(machine learning|deep learning|tensorflow|pytorch|scikit-learn|nlp|computer vision)\b',
-            r'\b(git|jira|confluence|linux|agile|scrum)\b',
-        ]
+        self._skill_pattern = _compile_skill_pattern(
+            r"\b("
+            + "|".join(re.escape(s) for s in sorted(SKILL_VOCAB, key=len, reverse=True))
+            + r")\b"
+        )
+        # Each vocabulary skill is one bit, so per-job set algebra is int ops
+        self._skill_bit = {skill: 1 << i for i, skill in enumerate(SKILL_VOCAB)}
         self.critical_skills = [
             "python", "java", "javascript", "sql", "aws", "react", "docker",
         ]
@@ -55,18 +109,109 @@ class JobMatcher:
             logger.warning("No jobs found in vector store")
             return []
 
-        resume_skills = self._extract_skills(resume_text)
-        logger.info("Extracted %d skills from resume", len(resume_skills))
+        return self._rank_jobs(resume_text, retrieved_jobs, user_id)
+
+    def match_resumes_to_jobs(
+        self,
+        resume_texts: List[str],
+        top_k: int = 10,
+        force_refresh: bool = False,
+        location: str = "India",
+        user_id: Optional[str] = None,
+    ) -> List[List[Dict]]:
+        """
+        match_resume_to_jobs() for several resumes, in order.
+
+        All resumes are embedded and searched in one vector_store.batch_search()
+        call instead of one search per resume.  A refresh, when needed, uses
+        the first resume to pick the scrape query.
+        """
+        logger.info("Matching %d resumes to top %d jobs (user_id=%s)", len(resume_texts), top_k, user_id)
+        if not resume_texts:
+            return []
+
+        if force_refresh or vector_store.get_stats()["total_jobs"] < 20:
+            self._refresh_jobs(resume_texts[0], location, force_refresh)
+
+        # Jobs retrieved for several resumes are skill-scanned only once
+        job_bits_cache: Dict[str, int] = {}
+        results = []
+        for resume_text, retrieved_jobs in zip(
+            resume_texts, vector_store.batch_search(resume_texts, top_k=top_k * 2)
+        ):
+            if not retrieved_jobs:
+                logger.warning("No jobs found in vector store")
+                results.append([])
+            else:
+                results.append(self._rank_jobs(resume_text, retrieved_jobs, user_id, job_bits_cache))
+        return results
+
+    def _rank_jobs(
+        self,
+        resume_text: str,
+        retrieved_jobs: List[Dict],
+        user_id: Optional[str],
+        job_bits_cache: Optional[Dict[str, int]] = None,
+    ) -> List[Dict]:
+        """
+        Score, explain and sort the jobs retrieved for one resume.
+
+        ``job_bits_cache`` maps job descriptions to their skill bitmask and
+        may be shared across calls so each description is scanned once.
+        """
+        if job_bits_cache is None:
+            job_bits_cache = {}
+        resume_bits = self._skill_bits(resume_text)
+        logger.info("Extracted %d skills from resume", bin(resume_bits).count("1"))
 
         adaptive_weights = self._get_weights(user_id)
+        # Identical for every job; each result gets its own copy below so a
+        # caller mutating one match can't change the others
+        weights = {
+            "semantic": adaptive_weights["semantic"],
+            "skills":   adaptive_weights["skills"],
+            "title":    adaptive_weights["title"],
+        }
+
+        # Per-user engines and profile are loop-invariant; resolve them once
+        # instead of re-importing and re-loading the profile for every job.
+        feedback_engine = ranker = user_profile = None
+        if user_id:
+            try:
+                from backend.services.feedback_engine import get_feedback_engine
+                feedback_engine = get_feedback_engine()
+            except Exception as exc:
+                logger.warning("Personalisation skipped: %s", exc)
+            try:
+                from backend.services.learning_to_rank import get_ltr_engine
+                ranker = get_ltr_engine()
+            except Exception as exc:
+                logger.warning("LTR skipped: %s", exc)
+            if feedback_engine is not None:
+                # Get actual user profile from feedback engine for proper personalisation
+                try:
+                    user_profile = feedback_engine.get_profile(user_id)
+                except Exception:
+                    user_profile = None
 
         matches = []
-        for job in retrieved_jobs:
-            job_skills = self._extract_skills(job["description"])
-            matched    = list(set(resume_skills) & set(job_skills))
-            missing    = list(set(job_skills)   - set(resume_skills))
+        pending_explanations = []   # (index into matches, _generate_explanation args)
+        # Collection is cosine-space: distance = 1 - cos_sim ∈ [0, 2].
+        # Negative similarity carries no signal, so clamp to [0, 100] — one
+        # vector op for every retrieved job instead of per-job arithmetic.
+        distances = np.fromiter(
+            (job.get("distance", 0.5) for job in retrieved_jobs),
+            dtype=np.float64, count=len(retrieved_jobs),
+        )
+        sem_raws = np.clip(100.0 * (1.0 - distances), 0.0, 100.0).tolist()
+
+        for job, sem_raw in zip(retrieved_jobs, sem_raws):
+            job_bits = job_bits_cache.get(job["description"])
+            if job_bits is None:
+                job_bits = job_bits_cache[job["description"]] = self._skill_bits(job["description"])
+            matched  = self._bits_to_skills(job_bits & resume_bits)
+            missing  = self._bits_to_skills(job_bits & ~resume_bits)
 
-            sem_raw        = max(0.0, 100.0 * (1 - min(job.get("distance", 0.5), 1.0)))
             skill_raw      = self._skills_raw(matched, missing)
             title_raw      = self._calculate_title_match(resume_text, job["title"])
             title_raw_norm = title_raw * 5.0
@@ -87,10 +232,9 @@ class JobMatcher:
                 continue
 
             final_score = base_score
-            if user_id:
+            if feedback_engine is not None:
                 try:
-                    from backend.services.feedback_engine import get_feedback_engine
-                    final_score = get_feedback_engine().personalise_score(
+                    final_score = feedback_engine.personalise_score(
                         user_id,
                         job,
                         {"semantic": sem_raw, "skills": skill_raw, "title": title_raw_norm},
@@ -98,30 +242,21 @@ class JobMatcher:
                 except Exception as exc:
                     logger.warning("Personalisation skipped: %s", exc)
 
-            explanation = ""
             if final_score > 50:
-                explanation = self._generate_explanation(
+                pending_explanations.append((len(matches), (
                     resume_text,
                     job["title"],
                     job.get("company", ""),
                     job["description"],
                     matched,
                     missing,
-                )
+                )))
 
             ltr_score = None
             ltr_rank  = None
             personalised = False
-            if user_id:
+            if ranker is not None:
                 try:
-                    from backend.services.learning_to_rank import get_ltr_engine
-                    ranker = get_ltr_engine()
-                    # Get actual user profile from feedback engine for proper personalisation
-                    try:
-                        from backend.services.feedback_engine import get_feedback_engine
-                        user_profile = get_feedback_engine().get_profile(user_id)
-                    except Exception:
-                        user_profile = None
                     ltr_score = ranker.score_job(user_id, job, user_profile)
                     personalised = True
                 except Exception as exc:
@@ -136,14 +271,10 @@ class JobMatcher:
                 "semantic_score":  round(sem_raw,        1),
                 "skills_score":    round(skill_raw,      1),
                 "title_score":     round(title_raw_norm, 1),
-                "weights": {
-                    "semantic": adaptive_weights["semantic"],
-                    "skills":   adaptive_weights["skills"],
-                    "title":    adaptive_weights["title"],
-                },
+                "weights":         dict(weights),
                 "matched_skills":  matched[:8],
                 "missing_skills":  missing[:5],
-                "explanation":     explanation,
+                "explanation":     "",
                 "recommendation":  self._get_recommendation(final_score),
                 "apply_link":      job.get("apply_link", ""),
                 "ltr_score":       ltr_score,
@@ -151,6 +282,19 @@ class JobMatcher:
                 "personalised":    personalised,
             })
 
+        # One LLM round-trip per strong match dominates latency; issue them
+        # concurrently.  _generate_explanation never raises (it falls back
+        # to a template), so every slot gets filled.
+        if pending_explanations:
+            workers = min(len(pending_explanations), _EXPLANATION_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="explain") as pool:
+                explanations = pool.map(
+                    lambda args: self._generate_explanation(*args),
+                    [args for _, args in pending_explanations],
+                )
+                for (idx, _), explanation in zip(pending_explanations, explanations):
+                    matches[idx]["explanation"] = explanation
+
         matches.sort(key=lambda x: x["match_score"], reverse=True)
         return matches
 
@@ -205,32 +349,23 @@ class JobMatcher:
         return "software engineer"
 
     def _extract_skills(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        skills: set = set()
-        for pattern in self.skill_patterns:
-            for match in re.findall(pattern, text_lower, re.IGNORECASE):
-                if isinstance(match, tuple):
-                    skills.update(m for m in match if m)
-                else:
-                    skills.add(match.lower())
-        return sorted(skills)
+        return sorted(self._bits_to_skills(self._skill_bits(text)))
+
+    def _skill_bits(self, text: str) -> int:
+        """Bitmask of the SKILL_VOCAB entries found in ``text``."""
+        bits = 0
+        # Input is lower-cased, so the pattern needs no IGNORECASE flag
+        for skill in self._skill_pattern.findall(text.lower()):
+            bits |= self._skill_bit[skill]
+        return bits
+
+    def _bits_to_skills(self, bits: int) -> List[str]:
+        return [skill for skill, bit in self._skill_bit.items() if bits & bit]
 
     def _calculate_title_match(self, resume_text: str, job_title: str) -> float:
         resume_lower = resume_text.lower()
         title_lower  = job_title.lower()
-        title_words  = set(re.findall(r'\b[a-z]+\b', title_lower))
-
-        variations = {
-            "engineer":  ["engineer", "developer", "programmer", "architect"],
-            "developer": ["developer", "engineer", "programmer", "coder"],
-            "senior":    ["senior", "lead", "principal", "staff"],
-            "junior":    ["junior", "entry", "fresher", "graduate"],
-            "data":      ["data", "analytics", "analyst", "scientist"],
-            "cloud":     ["cloud", "aws", "azure", "gcp"],
-            "frontend":  ["frontend", "front-end", "ui", "react", "vue", "angular"],
-            "backend":   ["backend", "back-end", "api", "server"],
-            "fullstack": ["fullstack", "full-stack", "full stack"],
-        }
+        title_words  = set(_TITLE_WORD_RE.findall(title_lower))
 
         score = 0
         matched_terms: set = set()
@@ -238,8 +373,8 @@ class JobMatcher:
             if word in resume_lower:
                 score += 4
                 matched_terms.add(word)
-            elif word in variations:
-                for variant in variations[word]:
+            elif word in _TITLE_VARIATIONS:
+                for variant in _TITLE_VARIATIONS[word]:
                     if variant in resume_lower and variant not in matched_terms:
                         score += 2
                         matched_terms.add(variant)
@@ -0,0 +1,145 @@
+"""
+backend/services/onnx_embedder.py
+==================================
+ONNX Runtime embedder for sentence-transformers models.
+
+Exports the configured SentenceTransformer checkpoint (default
+``all-MiniLM-L6-v2``) to ONNX once and runs it through an ONNX Runtime
+session:
+
+* **CUDA** (``CUDAExecutionProvider`` available) — fp32 graph on the GPU.
+* **CPU** — weights quantised to int8 with the AVX-512 VNNI dynamic config,
+  ``intra_op_num_threads`` set to every core.
+
+Exports are cached under ``CHROMA_PERSIST_DIR/onnx/<model>/`` so restarts
+skip the export/quantise step.  Mean pooling and L2 normalisation are done
+in NumPy, so the output matches
+``SentenceTransformer.encode(..., normalize_embeddings=True)``.
+
+Only the ``encode()`` surface the vector store needs is implemented.
+
+Optional dependency::
+
+    pip install "optimum[onnxruntime]"
+
+Select it with ``EMBEDDING_BACKEND=onnx``.  Construction raises if the
+dependency is missing; the vector store then falls back to SentenceTransformer.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+from typing import List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_EXPORTED_FILE = "model.onnx"
+_QUANTIZED_FILE = "model_quantized.onnx"
+_CUDA_PROVIDER = "CUDAExecutionProvider"
+_CPU_PROVIDER = "CPUExecutionProvider"
+
+
+class OnnxEmbedder:
+    """Tokenise → ORT forward pass → mean-pool → L2-normalise."""
+
+    label = "ONNX"
+
+    def __init__(
+        self,
+        model_name: str,
+        cache_dir: Optional[Path] = None,
+        max_length: int = 256,
+    ):
+        import onnxruntime as ort
+        from transformers import AutoTokenizer
+
+        model_id = model_name if "/" in model_name else f"sentence-transformers/{model_name}"
+        if cache_dir is None:
+            from backend.core.config import settings
+            cache_dir = Path(settings.CHROMA_PERSIST_DIR) / "onnx"
+        export_dir = Path(cache_dir) / model_id.replace("/", "__")
+
+        use_cuda = _CUDA_PROVIDER in ort.get_available_providers()
+        session_options = ort.SessionOptions()
+        if use_cuda:
+            provider = _CUDA_PROVIDER
+            file_name = self._export(model_id, export_dir)
+            self.label = "ONNX (CUDA)"
+        else:
+            provider = _CPU_PROVIDER
+            session_options.intra_op_num_threads = os.cpu_count() or 1
+            file_name = self._export_quantized(model_id, export_dir)
+            self.label = "ONNX (int8)"
+
+        from optimum.onnxruntime import ORTModelForFeatureExtraction
+        self.model = ORTModelForFeatureExtraction.from_pretrained(
+            export_dir,
+            file_name=file_name,
+            provider=provider,
+            session_options=session_options,
+        )
+        self.tokenizer = AutoTokenizer.from_pretrained(model_id)
+        self.max_length = max_length
+        logger.info(f"{self.label} embedder ready ({model_id}, {export_dir})")
+
+    @staticmethod
+    def _export(model_id: str, export_dir: Path) -> str:
+        """Export the fp32 ONNX graph into ``export_dir`` unless it is cached."""
+        if not (export_dir / _EXPORTED_FILE).exists():
+            from optimum.onnxruntime import ORTModelForFeatureExtraction
+            logger.info(f"Exporting {model_id} to ONNX ({export_dir})...")
+            model = ORTModelForFeatureExtraction.from_pretrained(model_id, export=True)
+            model.save_pretrained(export_dir)
+        return _EXPORTED_FILE
+
+    @classmethod
+    def _export_quantized(cls, model_id: str, export_dir: Path) -> str:
+        """Export and int8-quantise into ``export_dir`` unless it is cached."""
+        if not (export_dir / _QUANTIZED_FILE).exists():
+            from optimum.onnxruntime import ORTQuantizer
+            from optimum.onnxruntime.configuration import AutoQuantizationConfig
+            cls._export(model_id, export_dir)
+            logger.info(f"Quantising {model_id} to int8...")
+            quantizer = ORTQuantizer.from_pretrained(export_dir, file_name=_EXPORTED_FILE)
+            quantizer.quantize(
+                save_dir=export_dir,
+                quantization_config=AutoQuantizationConfig.avx512_vnni(is_static=False, per_channel=False),
+            )
+        return _QUANTIZED_FILE
+
+    def encode(
+        self,
+        texts: List[str],
+        batch_size: int = 64,
+        normalize_embeddings: bool = True,
+        **_: object,
+    ) -> np.ndarray:
+        """Embed ``texts``; returns a float32 array of shape (len(texts), dim)."""
+        chunks = []
+        for start in range(0, len(texts), batch_size):
+            batch = list(texts[start:start + batch_size])
+            encoded = self.tokenizer(
+                batch,
+                padding=True,
+                truncation=True,
+                max_length=self.max_length,
+                # Multiple-of-8 sequence lengths keep GEMM shapes on the
+                # fast (VNNI / Tensor Core) kernel paths.
+                pad_to_multiple_of=8,
+                return_tensors="np",
+            )
+            hidden = np.asarray(self.model(**encoded).last_hidden_state, dtype=np.float32)
+
+            mask = encoded["attention_mask"][..., None].astype(np.float32)
+            pooled = (hidden * mask).sum(axis=1) / np.clip(mask.sum(axis=1), 1e-9, None)
+            if normalize_embeddings:
+                norms = np.linalg.norm(pooled, axis=1, keepdims=True)
+                pooled = pooled / np.clip(norms, 1e-12, None)
+            chunks.append(pooled)
+
+        if not chunks:
+            return np.empty((0, self.model.config.hidden_size), dtype=np.float32)
+        return np.concatenate(chunks).astype(np.float32, copy=False)
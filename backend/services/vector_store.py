@@ -26,12 +26,60 @@ FIX-3  ChromaDB posthog telemetry errors
 FIX-4  Startup speed
        _ensure_embedder() is no longer triggered during get_stats() when
        the store hasn't been queried yet; saves ~5-20 s on cold starts.
+
+PERF-1 Memory-mapped query matrix
+       The L2-normalised embeddings are dumped to ``jobs.f16.npy``
+       (+ ``jobs.ids.json``) next to the Chroma sqlite file and mapped
+       read-only.  index_jobs() only marks the matrix dirty; the first
+       search after it rebuilds once, so a burst of index calls costs one
+       dump rather than one per call.  A ``jobs.stale`` marker records the dirty
+       state on disk, so a restart before that search still rebuilds.  search()/batch_search() score the whole corpus
+       with a single ``matrix @ queries`` product and only touch Chroma to
+       fetch the metadata of the winning rows.
+
+PERF-2 Versioned stats cache
+       get_stats() is polled by /health and every match request.  Its result
+       is cached against a version counter that index_jobs()/clear() bump,
+       so repeated polls no longer hit Chroma's sqlite COUNT(*) or run the
+       freshness query.
+
+PERF-3 Pipelined indexing
+       index_jobs() encodes in upsert-sized batches (_CHROMA_UPSERT_BATCH)
+       and submits each upsert to a small thread pool, so embedding batch
+       k+1 overlaps the Chroma upsert of batch k.
+       TF-IDF is fitted on the full corpus first so batching doesn't shrink
+       its vocabulary.
+
+PERF-4 Embedding cache
+       Embeddings are kept in an in-process LRU keyed by a BLAKE2b hash of
+       the text (plus the fit generation for TF-IDF).  Jobs re-scraped on
+       every poll, duplicate descriptions and repeated resume queries reuse
+       their vector instead of re-encoding.
+
+PERF-5 Semantic query cache
+       search() remembers the last 512 query vectors with their
+       results.  A new query within cosine 0.92 of a cached one (same
+       top_k, no index change since) returns the cached jobs without
+       scoring the matrix or touching Chroma.
+
+PERF-6 int8 matrix (opt-in)
+       With VECTOR_MATRIX_DTYPE=int8 the matrix stores round(v * 127) per
+       component instead of fp16, halving its footprint again.  Scores are
+       rescaled by the same fixed factor, so distances keep their meaning.
+       Chroma itself still stores float32; it has no quantised storage.
 """
 import chromadb
 from chromadb.config import Settings as ChromaSettings
-from typing import List, Dict
+from typing import List, Dict, Optional, Tuple
+import asyncio
+import copy
+import hashlib
+import json
 import logging
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from pathlib import Path
 from datetime import datetime
 import numpy as np
@@ -56,6 +104,64 @@ from backend.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+_COLLECTION_NAME = "job_listings"
+# Cosine space so Chroma's distance is 1 - cos_sim, which search() and the
+# matcher's semantic score assume.  A collection's space is fixed at creation.
+_COLLECTION_METADATA = {
+    "description":          "Job listings for RAG matching",
+    "hnsw:space":           "cosine",
+    "hnsw:construction_ef": 100,
+    "hnsw:M":               16,
+}
+
+# Upserts allowed in flight while the next batch is being encoded
+_UPSERT_WORKERS = 2
+
+# Jobs per collection.upsert() call.  Chroma pays one sqlite transaction per
+# call; 50-250 rows per call is its throughput sweet spot.
+_CHROMA_UPSERT_BATCH = 200
+
+# SentenceTransformer.encode batch size (GPU-friendly; sorted by length internally)
+_ENCODE_BATCH_SIZE = 64
+
+# Smallest batch worth sharding across the multi-process encode pool
+_MP_MIN_BATCH = 16
+
+# PERF-4: normalised vectors kept in the in-process embedding LRU
+_EMBED_CACHE_SIZE = 4096
+
+# PERF-5: semantic query cache — ring-buffer size and cosine hit threshold
+_QUERY_CACHE_SIZE = 512
+_QUERY_CACHE_MIN_SIM = 0.92
+
+# PERF-1: sidecar files written next to chroma.sqlite3, one per matrix dtype
+_MATRIX_FILES = {"float16": "jobs.f16.npy", "int8": "jobs.i8.npy"}
+_MATRIX_IDS_FILE = "jobs.ids.json"
+# Present from the first index write until the matrix is rebuilt, so a
+# process that exits in between leaves the next one a rebuild to do
+_MATRIX_STALE_FILE = "jobs.stale"
+
+# Rows fetched from Chroma per page when rebuilding the matrix
+_MATRIX_PAGE_SIZE = 1024
+
+# PERF-6: int8 matrix stores round(v * scale) for unit vectors v
+_INT8_SCALE = 127.0
+# Rows upcast to float32 per scoring step (bounds the temporary copy)
+_SCORE_CHUNK = 65536
+
+
+def _matrix_dtype() -> str:
+    dtype = settings.VECTOR_MATRIX_DTYPE.lower()
+    return dtype if dtype in _MATRIX_FILES else "float16"
+
+
+def _top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the ``k`` highest scores, best first — O(n + k log k)."""
+    if k >= scores.shape[0]:
+        return np.argsort(-scores, kind="stable")
+    part = np.argpartition(-scores, k - 1)[:k]
+    return part[np.argsort(-scores[part], kind="stable")]
+
 
 class VectorStore:
     def __init__(self):
@@ -70,33 +176,103 @@ class VectorStore:
             settings=ChromaSettings(
                 anonymized_telemetry=False,
                 allow_reset=True,
-                is_persistent=True,
             ),
         )
 
-        self.collection = self.client.get_or_create_collection(
-            name="job_listings",
-            metadata={"description": "Job listings for RAG matching"},
-        )
+        self.collection = self._open_collection()
 
         # Lazy-loaded embedder
         self.embedder = None
         self._dimension = 384          # target vector length
         self._embedder_initialized = False
-        self._use_tfidf = True         # TF-IDF on Render (memory-efficient)
+        self._mp_pool = None           # SentenceTransformer multi-process pool
+        # Async callers run encode-heavy work here instead of on the event
+        # loop; torch/numpy release the GIL inside their kernels.
+        self._write_lock = threading.Lock()
+        self._embedder_lock = threading.Lock()
+        self._exec = ThreadPoolExecutor(
+            max_workers=max(1, (os.cpu_count() or 2) // 2),
+            thread_name_prefix="encode",
+        )
+        self._upsert_exec = ThreadPoolExecutor(
+            max_workers=_UPSERT_WORKERS,
+            thread_name_prefix="chroma-upsert",
+        )
+        # TF-IDF unless EMBEDDING_BACKEND opts into a neural embedder
+        self._use_tfidf = settings.EMBEDDING_BACKEND.lower() == "tfidf"
         self._tfidf_fitted = False     # True after first fit_transform on a real corpus
+        self._tfidf_generation = 0     # bumped on every (re)fit; part of the cache key
         self._tfidf_corpus: List[str] = []
 
+        # PERF-1: (read-only fp16/int8 matrix, row ids) of the normalised
+        # embeddings.  Published as one tuple and replaced, never mutated:
+        # readers snapshot it once so rows and ids always belong together.
+        self._matrix: Optional[Tuple[np.ndarray, Tuple[str, ...]]] = None
+        self._load_matrix()
+        # Set by index_jobs(); the next search rebuilds the matrix once
+        # instead of every index call re-dumping the whole collection.
+        # A matrix missing, short, or left stale by a previous process
+        # (same row count, changed vectors) starts dirty.
+        mapped = len(self._matrix[1]) if self._matrix else 0
+        self._matrix_dirty = (
+            (Path(settings.CHROMA_PERSIST_DIR) / _MATRIX_STALE_FILE).exists()
+            or mapped != self.collection.count()
+        )
+
+        # PERF-4: [fit generation +] blake2b(text) → normalised embedding
+        self._embed_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+        self._embed_cache_lock = threading.Lock()
+
+        # PERF-2: bumped on every mutation; get_stats() caches against it
+        self._version = 0
+        self._stats_cache: Optional[tuple] = None
+
+        # PERF-5: ring buffer of recent query vectors and their results
+        self._query_cache_lock = threading.Lock()
+        self._query_cache_embs = np.zeros((_QUERY_CACHE_SIZE, self._dimension), dtype=np.float32)
+        self._query_cache_results: List[Optional[tuple]] = [None] * _QUERY_CACHE_SIZE
+        self._query_cache_len = 0
+        self._query_cache_pos = 0
+        self._query_cache_version = 0
+
         logger.info(f"Vector store initialized. Current jobs: {self.collection.count()}")
 
+    def _open_collection(self):
+        """Open the jobs collection, recreating it if it isn't cosine-space."""
+        # get_or_create_collection(metadata=...) on an existing collection
+        # overwrites its stored metadata without touching the index's
+        # distance function, so read the existing space before passing any.
+        try:
+            collection = self.client.get_collection(name=_COLLECTION_NAME)
+        except Exception:
+            # Missing — create it in cosine space
+            return self.client.get_or_create_collection(
+                name=_COLLECTION_NAME,
+                metadata=_COLLECTION_METADATA,
+            )
+
+        space = (collection.metadata or {}).get("hnsw:space", "l2")
+        if space != "cosine":
+            logger.warning(f"Collection uses '{space}' distance; recreating as cosine (jobs will re-index)")
+            self.client.delete_collection(_COLLECTION_NAME)
+            self._drop_matrix()
+            collection = self.client.get_or_create_collection(
+                name=_COLLECTION_NAME,
+                metadata=_COLLECTION_METADATA,
+            )
+        return collection
+
     # ── Embedder lifecycle ────────────────────────────────────────────────────
 
     def _ensure_embedder(self):
         """Load embedding model only when first needed (prevents OOM at startup)."""
-        if not self._embedder_initialized:
-            logger.info("Lazy-loading embedding model...")
-            self.embedder = self._init_embedder()
-            self._embedder_initialized = True
+        if self._embedder_initialized:
+            return
+        with self._embedder_lock:
+            if not self._embedder_initialized:
+                logger.info("Lazy-loading embedding model...")
+                self.embedder = self._init_embedder()
+                self._embedder_initialized = True
 
     def _init_embedder(self):
         is_render = os.environ.get("RENDER", "").lower() == "true"
@@ -111,47 +287,146 @@ class VectorStore:
                 strip_accents="unicode",
             )
 
-        try:
-            from backend.services.ollama_service import get_ollama_service
-            ollama_svc = get_ollama_service()
-            if ollama_svc.available:
-                logger.info(f"Using Ollama for embeddings ({ollama_svc.embedding_model})")
+        model_name = getattr(settings, "EMBEDDING_MODEL", "all-MiniLM-L6-v2")
+
+        if settings.EMBEDDING_BACKEND.lower() == "onnx":
+            try:
+                from backend.services.onnx_embedder import OnnxEmbedder
+                embedder = OnnxEmbedder(
+                    model_name, cache_dir=Path(settings.CHROMA_PERSIST_DIR) / "onnx"
+                )
                 self._use_tfidf = False
-                return ollama_svc
-        except Exception as e:
-            logger.info(f"Ollama skipped ({e})")
+                return embedder
+            except Exception as e:
+                logger.error(f"ONNX embedder failed ({e}); trying SentenceTransformer")
+        else:
+            try:
+                from backend.services.ollama_service import get_ollama_service
+                ollama_svc = get_ollama_service()
+                if ollama_svc.available:
+                    logger.info(f"Using Ollama for embeddings ({ollama_svc.embedding_model})")
+                    self._use_tfidf = False
+                    return ollama_svc
+            except Exception as e:
+                logger.info(f"Ollama skipped ({e})")
 
         try:
             from sentence_transformers import SentenceTransformer
-            model_name = getattr(settings, "EMBEDDING_MODEL", "all-MiniLM-L6-v2")
-            logger.info(f"Loading SentenceTransformer: {model_name}")
+            device = "cpu"
+            try:
+                import torch
+                if torch.cuda.is_available():
+                    device = "cuda"
+            except ImportError:
+                pass
+            logger.info(f"Loading SentenceTransformer: {model_name} on {device}")
+            model = SentenceTransformer(model_name, device=device)
+            if device == "cuda":
+                # fp16 weights halve encoder memory traffic on the GPU; rows
+                # are cast back to float32 once in _pad().
+                model.half()
             self._use_tfidf = False
-            return SentenceTransformer(model_name)
+            return model
         except Exception as e:
             logger.error(f"SentenceTransformer failed ({e}); falling back to TF-IDF")
+            self._use_tfidf = True
             from sklearn.feature_extraction.text import TfidfVectorizer
             return TfidfVectorizer(
                 max_features=self._dimension,
                 stop_words="english",
             )
 
+    def _get_mp_pool(self):
+        """Start the SentenceTransformer worker pool on first use."""
+        if self._mp_pool is None:
+            workers = max(1, (os.cpu_count() or 2) // 2)
+            logger.info(f"Starting embedding process pool ({workers} CPU workers)")
+            self._mp_pool = self.embedder.start_multi_process_pool(
+                target_devices=["cpu"] * workers,
+            )
+        return self._mp_pool
+
+    def close(self):
+        """Release background resources (encode/upsert threads, embedding worker processes)."""
+        self._exec.shutdown(wait=False)
+        self._upsert_exec.shutdown(wait=True)
+        if self._mp_pool is not None:
+            try:
+                self.embedder.stop_multi_process_pool(self._mp_pool)
+            except Exception as e:
+                logger.warning(f"Error stopping embedding pool: {e}")
+            self._mp_pool = None
+
     # ── FIX-1: pad TF-IDF vectors to self._dimension ─────────────────────────
 
-    def _pad(self, vec: list) -> list:
-        """Ensure vector is exactly self._dimension long (pad zeros / truncate)."""
-        if len(vec) < self._dimension:
-            vec = vec + [0.0] * (self._dimension - len(vec))
-        return vec[: self._dimension]
+    def _pad(self, vecs) -> np.ndarray:
+        """Make every row exactly self._dimension wide (zero-pad / truncate)."""
+        vecs = np.asarray(vecs, dtype=np.float32)
+        if vecs.ndim == 1:
+            vecs = vecs.reshape(1, -1) if vecs.size else vecs.reshape(0, self._dimension)
+        width = vecs.shape[1]
+        if width == self._dimension:
+            return vecs
+        if width > self._dimension:
+            return vecs[:, : self._dimension]
+        return np.pad(vecs, ((0, 0), (0, self._dimension - width)))
 
     # ── Embedding helpers ─────────────────────────────────────────────────────
 
-    def _get_embedding(self, text: str) -> List[float]:
-        """Embed a single text; always returns a list of length self._dimension."""
+    def _get_embedding(self, text: str) -> np.ndarray:
+        """Embed a single text; always returns a vector of length self._dimension."""
         return self._get_embeddings([text])[0]
 
-    def _get_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def _get_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Embed a list of texts as L2-normalised vectors of length self._dimension.
+
+        Unit vectors make ``1 - cosine_distance`` (Chroma, cosine space) and
+        the plain dot product (memmap path) the same similarity score.
+        Zero vectors (failed embeddings) are left as zeros.
+
+        PERF-4: embeddings are memoised by content hash, so re-indexed and
+        duplicate job texts, and repeated resume queries, skip the encoder.
+        TF-IDF vectors depend on the current fit, so their keys also carry
+        the fit generation and a refit never serves a stale vector.
+        """
+        self._ensure_embedder()
+        tag = self._tfidf_generation.to_bytes(8, "little") if self._use_tfidf else b""
+        keys = [tag + hashlib.blake2b(t.encode("utf-8"), digest_size=16).digest() for t in texts]
+        rows: List[Optional[np.ndarray]] = [None] * len(texts)
+        misses: List[int] = []
+        with self._embed_cache_lock:
+            for i, key in enumerate(keys):
+                cached = self._embed_cache.get(key)
+                if cached is None:
+                    misses.append(i)
+                else:
+                    self._embed_cache.move_to_end(key)
+                    rows[i] = cached
+
+        if misses:
+            fresh = self._normalise(self._embed_padded([texts[i] for i in misses]))
+            with self._embed_cache_lock:
+                for i, vec in zip(misses, fresh):
+                    rows[i] = vec
+                    if vec.any():  # don't pin failed (zero) embeddings
+                        self._embed_cache[keys[i]] = vec
+                        self._embed_cache.move_to_end(keys[i])
+                while len(self._embed_cache) > _EMBED_CACHE_SIZE:
+                    self._embed_cache.popitem(last=False)
+
+        return np.vstack(rows)
+
+    @staticmethod
+    def _normalise(vectors) -> np.ndarray:
+        vecs = np.asarray(vectors, dtype=np.float32)
+        norms = np.linalg.norm(vecs, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return vecs / norms
+
+    def _embed_padded(self, texts: List[str]) -> np.ndarray:
         """
-        Embed a list of texts.
+        Embed a list of texts into a float32 (len(texts), self._dimension) array.
 
         TF-IDF path
         -----------
@@ -167,13 +442,10 @@ class VectorStore:
         try:
             # ── Ollama ────────────────────────────────────────────────────────
             if hasattr(self.embedder, "get_embeddings"):
-                embs = self.embedder.get_embeddings(texts)
-                if isinstance(embs, np.ndarray):
-                    embs = embs.tolist()
-                return [self._pad(e) for e in embs]
+                return self._pad(self.embedder.get_embeddings(texts))
 
             if hasattr(self.embedder, "get_embedding"):
-                return [self._pad(self.embedder.get_embedding(t)) for t in texts]
+                return self._pad([self.embedder.get_embedding(t) for t in texts])
 
             # ── TF-IDF ────────────────────────────────────────────────────────
             if hasattr(self.embedder, "transform"):
@@ -181,46 +453,211 @@ class VectorStore:
                     # FIX-1: fit on provided texts (will be padded if vocab < 384)
                     raw = self.embedder.fit_transform(texts).toarray()
                     self._tfidf_fitted = True
+                    self._tfidf_generation += 1
                     self._tfidf_corpus = list(texts)
-                    return [self._pad(row.tolist()) for row in raw]
+                    return self._pad(raw)
                 else:
                     try:
                         raw = self.embedder.transform(texts).toarray()
-                        return [self._pad(row.tolist()) for row in raw]
+                        return self._pad(raw)
                     except Exception:
                         # Vocab changed — refit on union of old corpus + new texts
                         combined = self._tfidf_corpus + list(texts)
                         self.embedder.fit(combined)
+                        self._tfidf_generation += 1
                         self._tfidf_corpus = combined
                         raw = self.embedder.transform(texts).toarray()
-                        return [self._pad(row.tolist()) for row in raw]
+                        return self._pad(raw)
 
-            # ── SentenceTransformer ───────────────────────────────────────────
-            result = self.embedder.encode(texts)
-            if isinstance(result, np.ndarray):
-                result = result.tolist()
-            return [self._pad(r) for r in result]
+            # ── SentenceTransformer / ONNX ────────────────────────────────────
+            if (settings.EMBEDDING_MULTI_PROCESS and len(texts) >= _MP_MIN_BATCH
+                    and hasattr(self.embedder, "encode_multi_process")):
+                result = self.embedder.encode_multi_process(
+                    texts, self._get_mp_pool(), batch_size=_MP_MIN_BATCH,
+                )
+            else:
+                # Length-sorted, per-batch padded encode; stays an ndarray so
+                # the 384-float rows never round-trip through Python lists.
+                result = self.embedder.encode(
+                    texts,
+                    batch_size=_ENCODE_BATCH_SIZE,
+                    convert_to_numpy=True,
+                    show_progress_bar=False,
+                    normalize_embeddings=True,
+                )
+            return self._pad(result)
 
         except Exception as e:
             logger.error(f"Embedding error: {e}")
-            return [[0.0] * self._dimension for _ in texts]
+            return np.zeros((len(texts), self._dimension), dtype=np.float32)
+
+    # ── PERF-1: memory-mapped embedding matrix ───────────────────────────────
+
+    @staticmethod
+    def _matrix_paths() -> tuple:
+        base = Path(settings.CHROMA_PERSIST_DIR)
+        return base / _MATRIX_FILES[_matrix_dtype()], base / _MATRIX_IDS_FILE
+
+    def _load_matrix(self):
+        """Map the persisted fp16/int8 matrix read-only (no-op if absent or stale)."""
+        self._matrix = None
+        matrix_path, ids_path = self._matrix_paths()
+        if not (matrix_path.exists() and ids_path.exists()):
+            return
+        try:
+            mm = np.load(matrix_path, mmap_mode="r")
+            ids = json.loads(ids_path.read_text())
+            if mm.ndim != 2 or mm.shape[0] != len(ids) or mm.shape[1] != self._dimension:
+                logger.warning(f"Ignoring stale embedding matrix {mm.shape} at {matrix_path}")
+                return
+            self._matrix = (mm, tuple(ids))
+            logger.info(f"Mapped embedding matrix: {mm.shape[0]} jobs")
+        except Exception as e:
+            logger.warning(f"Could not map embedding matrix ({e})")
+
+    def _drop_matrix(self):
+        self._matrix = None
+        base = Path(settings.CHROMA_PERSIST_DIR)
+        for name in (*_MATRIX_FILES.values(), _MATRIX_IDS_FILE, _MATRIX_STALE_FILE):
+            path = base / name
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Could not remove {path}: {e}")
+
+    def _mark_matrix_dirty(self):
+        """Flag the matrix for rebuild, on disk too so it survives a restart."""
+        self._matrix_dirty = True
+        try:
+            (Path(settings.CHROMA_PERSIST_DIR) / _MATRIX_STALE_FILE).touch()
+        except OSError as e:
+            logger.warning(f"Could not write matrix stale marker: {e}")
+
+    def _refresh_matrix(self) -> bool:
+        """
+        Rebuild the matrix if index_jobs() left it dirty.
+
+        Returns False when an index_jobs() call still holds the write lock;
+        the caller should search Chroma rather than wait for it.
+        """
+        if not self._write_lock.acquire(blocking=False):
+            return False
+        try:
+            if self._matrix_dirty:
+                self._matrix_dirty = False
+                self._persist_matrix()
+        finally:
+            self._write_lock.release()
+        return True
+
+    def _persist_matrix(self):
+        """
+        Dump every stored embedding, L2-normalised, into a float16 (or
+        int8, see PERF-6) .npy file.
+
+        Chroma remains the write-through ID/metadata index; the matrix is only
+        a read-side copy, so any failure here just sends search() back to
+        the Chroma HNSW query.
+        """
+        matrix_path, ids_path = self._matrix_paths()
+        try:
+            total = self.collection.count()
+            if not total:
+                self._drop_matrix()
+                return
+
+            # Stream from Chroma a page at a time so peak memory is one page
+            # of Python float lists, not the whole collection.
+            int8 = _matrix_dtype() == "int8"
+            tmp_path = matrix_path.with_name(matrix_path.stem + ".tmp.npy")
+            out = np.lib.format.open_memmap(
+                tmp_path, mode="w+", dtype=np.int8 if int8 else np.float16,
+                shape=(total, self._dimension),
+            )
+            ids: List[str] = []
+            for offset in range(0, total, _MATRIX_PAGE_SIZE):
+                page = self.collection.get(
+                    include=["embeddings"], limit=_MATRIX_PAGE_SIZE, offset=offset,
+                )
+                page_ids = page.get("ids") or []
+                if not page_ids:
+                    break
+                unit = self._normalise(page["embeddings"])
+                rows = slice(len(ids), len(ids) + len(page_ids))
+                out[rows] = np.clip(np.rint(unit * _INT8_SCALE), -127, 127) if int8 else unit
+                ids.extend(page_ids)
+            out.flush()
+            del out
+
+            if len(ids) != total:
+                raise RuntimeError(f"collection changed while persisting ({len(ids)}/{total} rows)")
+
+            # Release the old mapping before replacing the file underneath it
+            self._matrix = None
+            os.replace(tmp_path, matrix_path)
+            ids_path.write_text(json.dumps(ids))
+            self._load_matrix()
+            (Path(settings.CHROMA_PERSIST_DIR) / _MATRIX_STALE_FILE).unlink(missing_ok=True)
+        except Exception as e:
+            logger.error(f"Error persisting embedding matrix: {e}")
+            self._matrix = None
+
+    @staticmethod
+    def _to_job(job_id: str, metadata: Dict, document: str, base_distance: float) -> Dict:
+        """Shape one stored job into the dict returned by search()."""
+        days_old = int(metadata.get("days_old", "7"))
+        freshness_boost = 0.1 * max(0, (30 - min(days_old, 30)) / 30)
+        adjusted_distance = max(0, base_distance - freshness_boost)
+
+        return {
+            "id":              job_id,
+            "title":           metadata.get("title",           ""),
+            "company":         metadata.get("company",         ""),
+            "location":        metadata.get("location",        ""),
+            "description":     document or "",
+            "apply_link":      metadata.get("apply_link",      ""),
+            "employment_type": metadata.get("employment_type", "Full-time"),
+            "posted_at":       metadata.get("posted_at",       ""),
+            "source":          metadata.get("source",          ""),
+            "days_old":        int(metadata.get("days_old",    "0")),
+            "fetched_at":      metadata.get("fetched_at",      ""),
+            "distance":        adjusted_distance,
+            "base_distance":   base_distance,
+        }
 
     # ── Public methods ────────────────────────────────────────────────────────
 
     def index_jobs(self, jobs: List[Dict]) -> int:
         """Index jobs into ChromaDB, auto-resetting on dimension mismatch."""
+        # Callers may run on several worker threads; indexing (TF-IDF fit,
+        # dedup check, upserts) must not interleave.
+        with self._write_lock:
+            try:
+                return self._index_jobs(jobs)
+            finally:
+                # PERF-2/PERF-5: bump only once every write has landed, so a
+                # get_stats()/search() that ran mid-write can't cache its
+                # partial view under the final version.
+                self._version += 1
+
+    def _index_jobs(self, jobs: List[Dict]) -> int:
         if not jobs:
             logger.warning("No jobs to index")
             return 0
 
         logger.info(f"Indexing {len(jobs)} jobs...")
         documents, metadatas, ids = [], [], []
+        seen_ids, seen_docs = set(), set()
 
         for job in jobs:
             job_id = job.get("id")
             if not isinstance(job_id, str) or not job_id.strip():
                 logger.error(f"Skipping job with invalid id: {job_id}")
                 continue
+            if job_id in seen_ids:
+                continue  # duplicate IDs in one upsert are rejected by Chroma
 
             title = job.get("title", "")
             description = job.get("description", "")
@@ -230,6 +667,10 @@ class VectorStore:
                 description = f"We are hiring for {title} position."
 
             doc_text = f"{title}. {description}"
+            if doc_text in seen_docs:
+                continue  # same posting scraped twice (e.g. overlapping pages)
+            seen_ids.add(job_id)
+            seen_docs.add(doc_text)
             documents.append(doc_text)
             metadatas.append({
                 "title":           str(title),
@@ -250,101 +691,320 @@ class VectorStore:
             logger.warning("No valid jobs after validation")
             return 0
 
+        total = len(ids)
+        documents, metadatas, ids = self._refresh_unchanged(documents, metadatas, ids)
+        if not documents:
+            logger.info(f"All {total} jobs already indexed; metadata refreshed")
+            return total
+
         logger.info("Generating embeddings...")
         try:
-            embeddings = self._get_embeddings(documents)
-            self.collection.upsert(
-                documents=documents,
-                metadatas=metadatas,
-                embeddings=embeddings,
-                ids=ids,
-            )
+            # Marked before writing: a crash mid-upsert must still leave a rebuild
+            self._mark_matrix_dirty()
+            self._write_pipelined(documents, metadatas, ids)
             self._count_cache = self.collection.count()
-            logger.info(f"Indexed {len(ids)} jobs. Total: {self._count_cache}")
-            return len(ids)
+            logger.info(f"Indexed {len(ids)} new/changed jobs ({total} received). Total: {self._count_cache}")
+            return total
 
         except Exception as e:
             if "dimension" in str(e).lower():
                 # FIX-2: stale collection from a different embedding model — reset and retry
                 logger.warning(f"Dimension mismatch during index ({e}); resetting collection and retrying")
-                self.clear()
+                self.clear(hard_reset=True)
                 self._tfidf_fitted = False
                 self._tfidf_corpus = []
-                embeddings = self._get_embeddings(documents)
-                self.collection.upsert(
-                    documents=documents,
-                    metadatas=metadatas,
-                    embeddings=embeddings,
-                    ids=ids,
-                )
+                self._mark_matrix_dirty()
+                self._write_pipelined(documents, metadatas, ids)
                 self._count_cache = self.collection.count()
                 logger.info(f"Indexed {len(ids)} jobs after reset. Total: {self._count_cache}")
-                return len(ids)
+                return total
             logger.error(f"Index error: {e}")
             raise
 
-    def search(self, query_text: str, top_k: int = 10) -> List[Dict]:
-        """Semantic search; auto-resets on dimension mismatch."""
-        logger.info(f"Searching top {top_k}...")
+    def _refresh_unchanged(self, documents: List[str], metadatas: List[Dict], ids: List[str]) -> tuple:
+        """
+        Split off jobs already stored with identical text.
+
+        Those only get their metadata (days_old, fetched_at, …) refreshed via
+        collection.update(); the remaining jobs are returned for embedding.
+        Skipped while TF-IDF is unfitted in this process, since stored vectors
+        from an earlier fit don't share the new vocabulary.
+        """
+        if not self._embedder_initialized or (self._use_tfidf and not self._tfidf_fitted):
+            return documents, metadatas, ids
+
+        try:
+            stored = self.collection.get(ids=ids, include=["documents"])
+        except Exception as e:
+            logger.warning(f"Could not check for already-indexed jobs ({e})")
+            return documents, metadatas, ids
+
+        stored_docs = dict(zip(stored.get("ids") or [], stored.get("documents") or []))
+        unchanged = [i for i, job_id in enumerate(ids) if stored_docs.get(job_id) == documents[i]]
+        if not unchanged:
+            return documents, metadatas, ids
+
+        self.collection.update(
+            ids=[ids[i] for i in unchanged],
+            metadatas=[metadatas[i] for i in unchanged],
+        )
+        logger.info(f"Skipping re-embedding for {len(unchanged)} unchanged jobs")
+
+        skip = set(unchanged)
+        keep = [i for i in range(len(ids)) if i not in skip]
+        return (
+            [documents[i] for i in keep],
+            [metadatas[i] for i in keep],
+            [ids[i] for i in keep],
+        )
+
+    def _fit_embedder(self, documents: List[str]):
+        """Fit TF-IDF on the whole incoming corpus before it is encoded in batches."""
+        self._ensure_embedder()
+        if self._use_tfidf and hasattr(self.embedder, "fit") and not self._tfidf_fitted:
+            self.embedder.fit(documents)
+            self._tfidf_fitted = True
+            self._tfidf_generation += 1
+            self._tfidf_corpus = list(documents)
+
+    def _write_pipelined(self, documents: List[str], metadatas: List[Dict], ids: List[str]):
+        """
+        PERF-3: encode batch k+1 while batch k is upserted into Chroma.
+
+        The caller thread encodes each batch and submits its upsert to
+        ``_upsert_exec``; at most _UPSERT_WORKERS upserts are in flight, so
+        wall time approaches max(encode, write) instead of their sum while
+        memory stays bounded.  Writer errors surface through Future.result().
+        """
+        self._fit_embedder(documents)
+
+        pending: List[Future] = []
+        try:
+            for start in range(0, len(ids), _CHROMA_UPSERT_BATCH):
+                end = start + _CHROMA_UPSERT_BATCH
+                embeddings = self._get_embeddings(documents[start:end])
+                if len(pending) >= _UPSERT_WORKERS:
+                    pending.pop(0).result()
+                pending.append(self._upsert_exec.submit(
+                    self.collection.upsert,
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    embeddings=embeddings,
+                    ids=ids[start:end],
+                ))
+        finally:
+            wait(pending)
+
+        for future in pending:
+            future.result()
+
+    def _search_chroma(self, texts: List[str], top_k: int = 10) -> List[List[Dict]]:
+        """HNSW search through Chroma; auto-resets on dimension mismatch."""
+        logger.info(f"Searching top {top_k} for {len(texts)} queries...")
+        no_results = [[] for _ in texts]
 
         total_jobs = self.collection.count()
         if total_jobs == 0:
             logger.warning("No jobs in vector store")
-            return []
+            return no_results
 
         # FIX-4: if TF-IDF not fitted yet, we cannot query reliably — skip
         if self._use_tfidf and not self._tfidf_fitted:
             logger.warning("TF-IDF not fitted yet — skipping search until first index_jobs()")
-            return []
+            return no_results
 
         try:
-            query_embedding = self._get_embeddings([query_text])
+            # All query embeddings go to Chroma in one call
+            query_embeddings = self._get_embeddings(texts)
             results = self.collection.query(
-                query_embeddings=query_embedding,
+                query_embeddings=query_embeddings,
                 n_results=min(top_k * 2, total_jobs),
             )
 
-            jobs = []
-            if results.get("metadatas") and results["metadatas"]:
-                for idx, metadata in enumerate(results["metadatas"][0]):
-                    base_distance = (results["distances"][0][idx]
-                                     if results.get("distances") else 0.5)
-                    days_old = int(metadata.get("days_old", "7"))
-                    freshness_boost = 0.1 * max(0, (30 - min(days_old, 30)) / 30)
-                    adjusted_distance = max(0, base_distance - freshness_boost)
-
-                    jobs.append({
-                        "id":              results["ids"][0][idx],
-                        "title":           metadata.get("title",           ""),
-                        "company":         metadata.get("company",         ""),
-                        "location":        metadata.get("location",        ""),
-                        "description":     (results["documents"][0][idx]
-                                            if results.get("documents") else ""),
-                        "apply_link":      metadata.get("apply_link",      ""),
-                        "employment_type": metadata.get("employment_type", "Full-time"),
-                        "posted_at":       metadata.get("posted_at",       ""),
-                        "source":          metadata.get("source",          ""),
-                        "days_old":        int(metadata.get("days_old",    "0")),
-                        "fetched_at":      metadata.get("fetched_at",      ""),
-                        "distance":        adjusted_distance,
-                        "base_distance":   base_distance,
-                    })
-
-            jobs.sort(key=lambda x: x["distance"])
-            logger.info(f"Found {len(jobs)} matching jobs")
-            return jobs[:top_k]
+            batches = []
+            for q_idx in range(len(texts)):
+                jobs = []
+                if results.get("metadatas") and results["metadatas"][q_idx]:
+                    for idx, metadata in enumerate(results["metadatas"][q_idx]):
+                        base_distance = (results["distances"][q_idx][idx]
+                                         if results.get("distances") else 0.5)
+                        document = (results["documents"][q_idx][idx]
+                                    if results.get("documents") else "")
+                        jobs.append(self._to_job(
+                            results["ids"][q_idx][idx], metadata, document, base_distance,
+                        ))
+
+                jobs.sort(key=lambda x: x["distance"])
+                batches.append(jobs[:top_k])
+
+            logger.info(f"Found {sum(len(jobs) for jobs in batches)} matching jobs")
+            return batches
 
         except Exception as e:
             if "dimension" in str(e).lower():
                 # FIX-2: stale embedding mismatch — nuke collection so next
                 # index_jobs() rebuilds it with the current embedder.
                 logger.warning(f"Dimension mismatch on search ({e}); clearing stale collection")
-                self.clear()
+                self.clear(hard_reset=True)
                 self._tfidf_fitted = False
                 self._tfidf_corpus = []
-                return []
+                return no_results
             logger.error(f"Search error: {e}")
+            return no_results
+
+    def search(self, query_text: str, top_k: int = 10) -> List[Dict]:
+        """Top ``top_k`` jobs for one query — see batch_search()."""
+        return self.batch_search([query_text], top_k=top_k)[0]
+
+    def batch_search(self, texts: List[str], top_k: int = 10) -> List[List[Dict]]:
+        """
+        PERF-1: brute-force search over the memory-mapped fp16 matrix.
+
+        Embeds every query in one batch and scores the whole corpus against
+        all uncached queries with a single ``matrix @ queries`` GEMM,
+        partially selects each query's best candidates with argpartition
+        (sorting only those k), then fetches the union of their metadata
+        from Chroma in one call.  Falls back to a batched Chroma HNSW query
+        (_search_chroma) when no matrix exists.
+
+        Returns one result list per entry of ``texts``, in order.
+        """
+        if not texts:
             return []
+        if self._matrix_dirty and not self._refresh_matrix():
+            # Mid-index: Chroma already holds the new rows, the matrix doesn't
+            return self._search_chroma(texts, top_k=top_k)
+        # One read of the published matrix: indexing may swap it meanwhile
+        matrix = self._matrix
+        if matrix is None or not matrix[1]:
+            return self._search_chroma(texts, top_k=top_k)
+        mm, mm_ids = matrix
+        if self._use_tfidf and not self._tfidf_fitted:
+            logger.warning("TF-IDF not fitted yet — skipping search until first index_jobs()")
+            return [[] for _ in texts]
+
+        try:
+            queries = self._get_embeddings(texts)
+            batches: List[List[Dict]] = [[] for _ in texts]
+
+            pending = []
+            for q_idx, q32 in enumerate(queries):
+                if not q32.any():
+                    continue
+                cached = self._query_cache_lookup(q32, top_k)
+                if cached is not None:
+                    batches[q_idx] = cached
+                else:
+                    pending.append(q_idx)
+
+            if len(pending) < len(texts):
+                logger.info(f"{len(texts) - len(pending)} of {len(texts)} queries served from cache")
+            if not pending:
+                return batches
+
+            scores = self._score_matrix(mm, queries[pending].T)
+            candidates = {}
+            for col, q_idx in enumerate(pending):
+                column = scores[:, col]
+                candidates[q_idx] = {
+                    mm_ids[i]: 1.0 - float(column[i])
+                    for i in _top_k_indices(column, top_k * 2)
+                }
+
+            candidate_ids = list(dict.fromkeys(
+                job_id for distances in candidates.values() for job_id in distances
+            ))
+            rows = self.collection.get(ids=candidate_ids, include=["metadatas", "documents"])
+            found_ids = rows.get("ids") or []
+            documents = rows.get("documents") or [""] * len(found_ids)
+            found = {
+                job_id: (rows["metadatas"][pos] or {}, documents[pos])
+                for pos, job_id in enumerate(found_ids)
+            }
+
+            for q_idx in pending:
+                jobs = [
+                    self._to_job(job_id, *found[job_id], distance)
+                    for job_id, distance in candidates[q_idx].items()
+                    if job_id in found
+                ]
+                jobs.sort(key=lambda x: x["distance"])
+                batches[q_idx] = jobs[:top_k]
+                self._query_cache_store(queries[q_idx], top_k, batches[q_idx])
+
+            logger.info(f"Found {sum(len(jobs) for jobs in batches)} matching jobs (memmap)")
+            return batches
+
+        except Exception as e:
+            logger.error(f"Fast search error ({e}); falling back to Chroma query")
+            return self._search_chroma(texts, top_k=top_k)
+
+    @staticmethod
+    def _score_matrix(mm: np.ndarray, q: np.ndarray) -> np.ndarray:
+        """
+        Cosine score of every row of ``mm`` against the unit query ``q``
+        (shape ``(dim,)``), or against each column of ``q`` (``(dim, m)``).
+        """
+        # fp16/int8 are storage formats only: numpy has no BLAS kernel for
+        # float16 and no int8 GEMM that doesn't overflow, so upcast to
+        # float32 in bounded chunks (the copy never spans the whole matrix)
+        # and let sgemv/sgemm do the scoring.
+        q = q.astype(np.float32, copy=False)
+        scores = np.empty((mm.shape[0],) + q.shape[1:], dtype=np.float32)
+        for start in range(0, mm.shape[0], _SCORE_CHUNK):
+            end = start + _SCORE_CHUNK
+            scores[start:end] = mm[start:end].astype(np.float32) @ q
+        if mm.dtype == np.int8:
+            scores /= _INT8_SCALE
+        return scores
+
+    def _query_cache_lookup(self, q: np.ndarray, top_k: int) -> Optional[List[Dict]]:
+        """
+        PERF-5: results of a cached query whose vector is within
+        _QUERY_CACHE_MIN_SIM cosine of ``q`` and asked for the same top_k.
+
+        Entries from before the last index/clear (``_version``) are dropped.
+        """
+        with self._query_cache_lock:
+            if self._query_cache_version != self._version:
+                self._query_cache_len = 0
+                self._query_cache_pos = 0
+                self._query_cache_results = [None] * _QUERY_CACHE_SIZE
+                self._query_cache_version = self._version
+                return None
+            if not self._query_cache_len:
+                return None
+
+            sims = self._query_cache_embs[:self._query_cache_len] @ q
+            for slot in np.argsort(-sims):
+                if sims[slot] < _QUERY_CACHE_MIN_SIM:
+                    return None
+                cached_top_k, jobs = self._query_cache_results[slot]
+                if cached_top_k == top_k:
+                    return copy.deepcopy(jobs)
+            return None
+
+    def _query_cache_store(self, q: np.ndarray, top_k: int, jobs: List[Dict]):
+        with self._query_cache_lock:
+            if self._query_cache_version != self._version:
+                return
+            slot = self._query_cache_pos
+            self._query_cache_embs[slot] = q
+            self._query_cache_results[slot] = (top_k, copy.deepcopy(jobs))
+            self._query_cache_pos = (slot + 1) % _QUERY_CACHE_SIZE
+            self._query_cache_len = min(self._query_cache_len + 1, _QUERY_CACHE_SIZE)
+
+    # ── Async wrappers (FastAPI handlers) ─────────────────────────────────────
+
+    async def aindex_jobs(self, jobs: List[Dict]) -> int:
+        """index_jobs() on the encode pool so the event loop stays responsive."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._exec, self.index_jobs, jobs)
+
+    async def asearch(self, query_text: str, top_k: int = 10) -> List[Dict]:
+        """search() on the encode pool so the event loop stays responsive."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._exec, self.search, query_text, top_k)
 
     def get_stats(self) -> Dict:
         """
@@ -353,7 +1013,14 @@ class VectorStore:
         FIX-1 / FIX-4: skip the freshness ChromaDB query when TF-IDF hasn't
         been fitted yet; avoids the 'dimension 1 ≠ 384' error logged on every
         cold start.
+
+        PERF-2: the result is reused until the store is mutated or the
+        embedder state changes (lazy load / first TF-IDF fit).
         """
+        cache_key = (self._version, self._embedder_initialized, self._tfidf_fitted)
+        if self._stats_cache is not None and self._stats_cache[0] == cache_key:
+            return dict(self._stats_cache[1])
+
         count_cache = getattr(self, "_count_cache", -1)
         count = count_cache if count_cache >= 0 else self.collection.count()
         self._count_cache = count
@@ -386,10 +1053,11 @@ class VectorStore:
                 logger.error(f"Error checking freshness: {e}")
 
         embedder_info = "TF-IDF" if self._use_tfidf else (
-            "Ollama" if hasattr(self.embedder, "available") else "SentenceTransformer"
+            "Ollama" if hasattr(self.embedder, "available")
+            else getattr(self.embedder, "label", "SentenceTransformer")
         )
 
-        return {
+        stats = {
             "total_jobs":        count,
             "collection_name":   self.collection.name,
             "persist_directory": settings.CHROMA_PERSIST_DIR,
@@ -397,13 +1065,30 @@ class VectorStore:
             "avg_days_old":      round(avg_days_old, 1),
             "embedder":          embedder_info,
         }
+        self._stats_cache = (cache_key, stats)
+        return dict(stats)
 
-    def clear(self):
-        """Clear all jobs from the vector store."""
+    def clear(self, hard_reset: bool = False):
+        """
+        Clear all jobs from the vector store.
+
+        By default the jobs are deleted by ID so the collection (and its HNSW
+        index) is reused by the next bulk index.  ``hard_reset=True`` drops and
+        recreates the collection — required when the embedding dimension
+        changes, since a collection's dimension is fixed.
+        """
         try:
-            self.client.delete_collection("job_listings")
-            self.collection = self.client.get_or_create_collection(name="job_listings")
+            if hard_reset:
+                self.client.delete_collection(_COLLECTION_NAME)
+                self.collection = self._open_collection()
+            else:
+                all_ids = self.collection.get(include=[])["ids"]
+                if all_ids:
+                    self.collection.delete(ids=all_ids)
             self._count_cache = 0
+            self._version += 1
+            self._matrix_dirty = False
+            self._drop_matrix()
             logger.info("Vector store cleared")
         except Exception as e:
             logger.error(f"Error clearing vector store: {e}")
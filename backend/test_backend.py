@@ -6,11 +6,27 @@ Run this from project root: python test_backend.py
 
 import sys
 import os
+import io
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from importlib.util import find_spec
 from pathlib import Path
 
+_ENV_PATH = Path( "backend/.env" )
+_ENV_KEYS = ("SERPAPI_KEY", "SEARCHAPI_KEY", "GEMINI_API_KEY")
+
+
+@lru_cache( maxsize=1 )
+def _load_env () -> dict :
+    """Parse backend/.env once per process and return the keys the checks use"""
+    from dotenv import load_dotenv
+    load_dotenv( _ENV_PATH )
+    return {key : os.environ.get( key ) for key in _ENV_KEYS}
+
 
 def test_imports () :
-    """Test if all required packages can be imported"""
+    """Test if all required packages are installed (found, not imported)"""
     print( "🔍 Testing Python package imports..." )
 
     required_packages = [
@@ -21,15 +37,16 @@ def test_imports () :
         ("pdfplumber", "PDFPlumber"),
         ("docx", "python-docx"),
         ("dotenv", "python-dotenv"),
-        ("google_search_results", "SerpAPI"),
+        ("httpx", "httpx (SerpAPI client)"),
     ]
 
     all_good = True
     for package, name in required_packages :
-        try :
-            __import__( package )
+        # find_spec locates the package without executing it, so this check
+        # doesn't pay for importing torch, chromadb, etc.
+        if find_spec( package ) is not None :
             print( f"  ✅ {name}" )
-        except ImportError :
+        else :
             print( f"  ❌ {name} - Run: pip install {package}" )
             all_good = False
 
@@ -40,9 +57,7 @@ def test_env_file () :
     """Check if .env file exists and has required keys"""
     print( "\n🔍 Checking environment configuration..." )
 
-    env_path = Path( "backend/.env" )
-
-    if not env_path.exists() :
+    if not _ENV_PATH.exists() :
         print( "  ❌ .env file not found at backend/.env" )
         print( "  📝 Create it with:" )
         print( "     SERPAPI_KEY=your_key_here" )
@@ -52,11 +67,10 @@ def test_env_file () :
     print( "  ✅ .env file exists" )
 
     # Try to load it
-    from dotenv import load_dotenv
-    load_dotenv( env_path )
+    env = _load_env()
 
-    serpapi_key = os.getenv( "SERPAPI_KEY" ) or os.getenv( "SEARCHAPI_KEY" )
-    gemini_key = os.getenv( "GEMINI_API_KEY" )
+    serpapi_key = env["SERPAPI_KEY"] or env["SEARCHAPI_KEY"]
+    gemini_key = env["GEMINI_API_KEY"]
 
     all_good = True
 
@@ -97,17 +111,36 @@ def test_directory_structure () :
         "backend/services/vector_store.py",
     ]
 
+    # Resolve the project root once; every path below is joined onto it
+    root = Path.cwd().resolve()
+
+    # One directory scan per parent instead of one stat() per path; the
+    # scan entries also tell files from directories
+    listings = {}
+    for parent in {Path( p ).parent for p in required_dirs + required_files} :
+        try :
+            with os.scandir( root / parent ) as entries :
+                listings[parent] = {entry.name : entry.is_dir() for entry in entries}
+        except OSError :
+            listings[parent] = {}
+
+    def is_dir ( path: str ) -> bool :
+        return listings[Path( path ).parent].get( Path( path ).name ) is True
+
+    def is_file ( path: str ) -> bool :
+        return listings[Path( path ).parent].get( Path( path ).name ) is False
+
     all_good = True
 
     for dir_path in required_dirs :
-        if Path( dir_path ).exists() :
+        if is_dir( dir_path ) :
             print( f"  ✅ {dir_path}/" )
         else :
             print( f"  ❌ {dir_path}/ missing - Create it with: mkdir -p {dir_path}" )
             all_good = False
 
     for file_path in required_files :
-        if Path( file_path ).exists() :
+        if is_file( file_path ) :
             print( f"  ✅ {file_path}" )
         else :
             print( f"  ❌ {file_path} missing" )
@@ -120,43 +153,81 @@ def test_backend_import () :
     """Try to import backend modules"""
     print( "\n🔍 Testing backend module imports..." )
 
-    try :
-        sys.path.insert( 0, str( Path.cwd() ) )
+    # These imports pull in chromadb, torch and the LLM clients; set
+    # CAREERGENIE_SKIP_HEAVY=1 for a quick check of everything else.
+    if os.getenv( "CAREERGENIE_SKIP_HEAVY" ) == "1" :
+        print( "  ⏭️  Skipped (CAREERGENIE_SKIP_HEAVY=1)" )
+        return True
 
+    sys.path.insert( 0, str( Path.cwd() ) )
+
+    try :
         from backend.config import settings
         print( "  ✅ backend.config" )
+    except Exception as e :
+        print( f"  ❌ backend.config - Import failed: {str( e )}" )
+        return False
 
-        from backend.services.vector_store import vector_store
-        print( "  ✅ backend.services.vector_store" )
+    backend_modules = [
+        ("backend.services.vector_store", "vector_store"),
+        ("backend.services.career_advisor", "career_advisor"),
+        ("backend.services.job_scraper", "get_job_scraper"),
+        ("backend.services.matcher", "get_job_matcher"),
+        ("backend.services.resume_parser", "resume_parser"),
+    ]
 
-        from backend.services.career_advisor import career_advisor
-        print( "  ✅ backend.services.career_advisor" )
+    # One try per module, so a failing import doesn't hide the others
+    all_good = True
+    for module, name in backend_modules :
+        try :
+            getattr( __import__( module, fromlist=[name] ), name )
+            print( f"  ✅ {module}" )
+        except Exception as e :
+            print( f"  ❌ {module} - Import failed: {str( e )}" )
+            all_good = False
 
-        from backend.services.job_scraper import job_scraper
-        print( "  ✅ backend.services.job_scraper" )
+    print( "\n📊 Configuration Status:" )
+    warnings = settings.validate_config()
+    if warnings :
+        print( "  ⚠️  Configuration warnings:" )
+        for warning in warnings :
+            print( f"     - {warning}" )
+    else :
+        print( "  ✅ All configuration valid" )
 
-        from backend.services.matcher import job_matcher
-        print( "  ✅ backend.services.matcher" )
+    return all_good
 
-        from backend.services.resume_parser import resume_parser
-        print( "  ✅ backend.services.resume_parser" )
 
-        print( "\n📊 Configuration Status:" )
-        errors = settings.validate()
-        if errors :
-            print( "  ⚠️  Configuration issues:" )
-            for error in errors :
-                print( f"     - {error}" )
-            return False
-        else :
-            print( "  ✅ All configuration valid" )
-            return True
+# Per-thread output buffer, so concurrent checks don't interleave their prints
+_captured = threading.local()
 
-    except Exception as e :
-        print( f"  ❌ Import failed: {str( e )}" )
-        import traceback
-        traceback.print_exc()
-        return False
+
+class _ThreadStdout :
+    """sys.stdout stand-in that writes to the current thread's buffer, if any"""
+
+    def __init__ ( self, stream ) :
+        self._stream = stream
+
+    def write ( self, text: str ) -> int :
+        return getattr( _captured, "buffer", self._stream ).write( text )
+
+    def flush ( self ) :
+        getattr( _captured, "buffer", self._stream ).flush()
+
+    def __getattr__ ( self, name: str ) :
+        # isatty, encoding, fileno, ... come from the real stream
+        return getattr( self._stream, name )
+
+
+def _run_captured ( test ) -> tuple :
+    """Run one check with its output buffered; returns (passed, output)"""
+    _captured.buffer = io.StringIO()
+    try :
+        passed = test()
+    finally :
+        output = _captured.buffer.getvalue()
+        del _captured.buffer
+    return passed, output
 
 
 def main () :
@@ -165,12 +236,35 @@ def main () :
     print( "Career Genie Backend Test Suite" )
     print( "=" * 60 )
 
-    results = []
+    tests = [
+        ("Package Imports", test_imports),
+        ("Directory Structure", test_directory_structure),
+        ("Environment Config", test_env_file),
+        ("Backend Modules", test_backend_import),
+    ]
+
+    # Load backend/.env up front: load_dotenv mutates os.environ, which
+    # backend.config reads while test_backend_import runs on another thread.
+    # A missing python-dotenv is reported by test_imports.
+    try :
+        _load_env()
+    except ImportError :
+        pass
 
-    results.append( ("Package Imports", test_imports()) )
-    results.append( ("Directory Structure", test_directory_structure()) )
-    results.append( ("Environment Config", test_env_file()) )
-    results.append( ("Backend Modules", test_backend_import()) )
+    # The checks are independent and mostly wait on disk and imports, so
+    # run them concurrently and print each one's output in the usual order.
+    results = []
+    stdout = sys.stdout
+    sys.stdout = _ThreadStdout( stdout )
+    try :
+        with ThreadPoolExecutor( max_workers=len( tests ) ) as pool :
+            futures = [(name, pool.submit( _run_captured, test )) for name, test in tests]
+            for name, future in futures :
+                passed, output = future.result()
+                stdout.write( output )
+                results.append( (name, passed) )
+    finally :
+        sys.stdout = stdout
 
     print( "\n" + "=" * 60 )
     print( "Test Summary" )
@@ -2,8 +2,11 @@
 """Test Ollama setup"""
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import sys
 
+OLLAMA_URL = "http://localhost:11434"
+
 
 def test_ollama () :
     print( "=" * 60 )
@@ -12,7 +15,7 @@ def test_ollama () :
 
     # Test connection
     try :
-        resp = requests.get( "http://localhost:11434/api/tags", timeout=5 )
+        resp = requests.get( f"{OLLAMA_URL}/api/tags", timeout=5 )
         if resp.status_code == 200 :
             models = resp.json().get( 'models', [] )
             print( f"✅ Ollama is running!" )
@@ -27,14 +30,33 @@ def test_ollama () :
         print( "   Make sure 'ollama serve' is running in another terminal" )
         return False
 
+    # The embedding and chat probes are independent: send both at once so
+    # the slow chat generation overlaps the embedding call.  Each worker
+    # opens its own connection (requests.Session isn't thread-safe).
+    pool = ThreadPoolExecutor( max_workers=2 )
+    embedding_probe = pool.submit(
+        requests.post,
+        f"{OLLAMA_URL}/api/embeddings",
+        json={"model" : "all-minilm", "prompt" : "Software Engineer with Python skills"},
+        timeout=30
+    )
+    chat_probe = pool.submit(
+        requests.post,
+        f"{OLLAMA_URL}/api/chat",
+        json={
+            "model" : "llama3.2:3b",
+            "messages" : [{"role" : "user", "content" : "Say 'hello world' in one word"}],
+            "stream" : False,
+            "options" : {"temperature" : 0.1}
+        },
+        timeout=60
+    )
+    pool.shutdown( wait=False )
+
     # Test embedding
     print( "\n📊 Testing embeddings..." )
     try :
-        resp = requests.post(
-            "http://localhost:11434/api/embeddings",
-            json={"model" : "all-minilm", "prompt" : "Software Engineer with Python skills"},
-            timeout=30
-        )
+        resp = embedding_probe.result()
         if resp.status_code == 200 :
             emb = resp.json().get( 'embedding', [] )
             print( f"   ✅ Embedding generated: {len( emb )} dimensions" )
@@ -48,16 +70,7 @@ def test_ollama () :
     # Test chat
     print( "\n💬 Testing chat..." )
     try :
-        resp = requests.post(
-            "http://localhost:11434/api/chat",
-            json={
-                "model" : "llama3.2:3b",
-                "messages" : [{"role" : "user", "content" : "Say 'hello world' in one word"}],
-                "stream" : False,
-                "options" : {"temperature" : 0.1}
-            },
-            timeout=60
-        )
+        resp = chat_probe.result()
         if resp.status_code == 200 :
             reply = resp.json().get( 'message', {} ).get( 'content', '' )
             print( f"   ✅ Chat response: {reply[:100]}" )
@@ -0,0 +1,43 @@
+"""Tests for CareerAdvisor._parse_response section splitting."""
+import pytest
+
+career_advisor = pytest.importorskip("backend.services.career_advisor")
+
+
+@pytest.fixture
+def advisor():
+    return career_advisor.CareerAdvisor()
+
+
+def test_body_text_starting_with_section_phrase_stays_in_body(advisor):
+    text = (
+        "1. CURRENT ASSESSMENT:\n"
+        "Current assessment shows a solid Python background.\n"
+        "3. MARKET INSIGHTS:\n"
+        "Market insights from Naukri show salaries rising for ML roles.\n"
+        "4. ACTION PLAN:\n"
+        "Action plan should be revisited monthly.\n"
+        "- Build two portfolio projects\n"
+    )
+
+    result = advisor._parse_response(text, [])
+
+    assert result["assessment"] == "Current assessment shows a solid Python background."
+    assert result["market_insights"] == (
+        "Market insights from Naukri show salaries rising for ML roles."
+    )
+    assert result["action_plan"] == ["Build two portfolio projects"]
+
+
+def test_header_without_colon_and_text_after_colon(advisor):
+    text = (
+        "**Market Insights**\n"
+        "Demand for data engineers keeps growing.\n"
+        "## Action Plan: - Learn Kubernetes basics\n"
+        "- Ship a Docker project\n"
+    )
+
+    result = advisor._parse_response(text, [])
+
+    assert result["market_insights"] == "Demand for data engineers keeps growing."
+    assert result["action_plan"] == ["Learn Kubernetes basics", "Ship a Docker project"]
@@ -0,0 +1,42 @@
+"""Tests for VectorStore collection handling."""
+import pytest
+
+chromadb = pytest.importorskip("chromadb")
+vector_store = pytest.importorskip("backend.services.vector_store")
+
+
+@pytest.fixture
+def persist_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(vector_store.settings, "CHROMA_PERSIST_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _seed_collection(persist_dir, space):
+    client = chromadb.PersistentClient(path=str(persist_dir))
+    collection = client.create_collection(
+        name=vector_store._COLLECTION_NAME,
+        metadata={"hnsw:space": space},
+    )
+    collection.add(ids=["job_1"], embeddings=[[0.1] * 384], documents=["Python developer"])
+
+
+def test_existing_l2_collection_is_recreated_as_cosine(persist_dir):
+    _seed_collection(persist_dir, "l2")
+
+    store = vector_store.VectorStore()
+    try:
+        assert store.collection.metadata["hnsw:space"] == "cosine"
+        assert store.collection.count() == 0
+    finally:
+        store.close()
+
+
+def test_existing_cosine_collection_is_kept(persist_dir):
+    _seed_collection(persist_dir, "cosine")
+
+    store = vector_store.VectorStore()
+    try:
+        assert store.collection.metadata["hnsw:space"] == "cosine"
+        assert store.collection.count() == 1
+    finally:
+        store.close()